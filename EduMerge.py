@@ -3,7 +3,8 @@
 # =============================================================================
 # GUI and Dialog imports
 from tkinter import filedialog, messagebox, colorchooser
-from tkinter import Text, END, LEFT, RIGHT, BOTTOM, TOP, X, Y, BOTH, W, E
+from tkinter import font as tkfont
+from tkinter import Text, TclError, END, LEFT, RIGHT, BOTTOM, TOP, X, Y, BOTH, W, E
 import ttkbootstrap as ttk
 from ttkbootstrap import Toplevel, Label, PhotoImage
 from ttkbootstrap.dialogs import Messagebox
@@ -12,16 +13,35 @@ from ttkbootstrap.constants import *
 from pathlib import Path
 
 # System imports
-import os, platform, subprocess
+import io, itertools, mmap, os, platform, queue, re, subprocess, threading, zipfile
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 
 # Image processing
 from PIL import Image, ImageTk
 
-# File format handling
+# File format handling (python-docx is imported where .docx files are written)
 import csv
-from docx import Document
-from docx.shared import Pt, RGBColor
-import pdf2image
+
+# PDF rendering: pypdfium2 renders in-process; pdf2image (needs poppler) is the fallback.
+# Both are imported when the first PDF is opened (see _pdf_renderers)
+_pdf_renderer_modules = None
+
+# WordprocessingML namespace used inside .docx files
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+# A word for the status bar is any run of non-whitespace characters
+_WORD_RE = re.compile(r"\S+")
+
+# A recipient name has at least one letter and may contain letters, spaces and hyphens.
+# [^\W\d_] also lets through numerals such as '½', so matches are confirmed with
+# str.isalpha() once these separators are removed (see _names_match)
+_NAME_RE = re.compile(r"[ \-]*[^\W\d_](?:[^\W\d_]|[ \-])*")
+_NAME_SEPARATORS = str.maketrans("", "", " -\0")
+
+# A whole NUL-joined list of names, so a file's names are checked in one match
+_NAME_LIST_RE = re.compile(rf"{_NAME_RE.pattern}(?:\0{_NAME_RE.pattern})*")
 
 
 # =============================================================================
@@ -34,6 +54,35 @@ class ModernEditorApp:
     Features: Rich text formatting, image insertion, export capabilities
     """
 
+    # PDF viewer settings
+    PDF_DPI = 110  # Render resolution (a letter page comes out ~935px wide)
+    PDF_PAGE_WIDTH = 800  # Pages wider than this are scaled down
+    PDF_PAGE_CACHE_SIZE = 8  # Rendered pages kept alive at once
+
+    # Image references held before those deleted from the text are released
+    MAX_IMAGES = 64
+
+    # Window title while no file is open
+    DEFAULT_TITLE = "EduText: Text Editor"
+
+    # Point size of each named font relative to the chosen base size
+    FONT_SIZE_OFFSETS = {
+        "base": 0, "bold": 0, "italic": 0, "underline": 0,
+        "heading1": 20, "heading2": 12, "heading3": 6,
+    }
+
+    # Characters read from disk per insert when opening a text file
+    OPEN_CHUNK_CHARS = 1 << 16
+
+    # Lines fetched from the text widget per read when streaming a save
+    SAVE_CHUNK_LINES = 2000
+
+    # Rows per CSV table page (only one page lives in the treeview at a time)
+    CSV_PAGE_SIZE = 50
+
+    # Quiet period after the last edit before status bar statistics refresh
+    STATUS_DELAY_MS = 120
+
     def __init__(self, root):
         """
         Initialize the text editor application.
@@ -42,25 +91,48 @@ class ModernEditorApp:
             root: The main tkinter window
         """
         self.root = root
-        self.root.title("EduText: Text Editor")
+        self._title = self.DEFAULT_TITLE  # Window title without the unsaved marker
+        self.root.title(self._title)
         self.root.geometry("1200x800")
-
-        # Set application icon (fails silently if file not found)
-        try:
-            self.root.iconbitmap("logo.ico")
-        except:
-            pass
+        # The application icon is already set on app_window at startup
 
         # Application state variables
         self.filename = None  # Current file path
         self.is_saved = True  # Track if document has unsaved changes
-        self.images = []  # Store PhotoImage objects to prevent garbage collection
+        self._last_open_dir = None  # Folder the open dialogs start in (None = OS default)
+        self._last_save_dir = None  # Folder the save dialogs start in
+        self._open_handlers = {  # File extension -> open method (others open as plain text)
+            ".csv": self.open_csv,
+            ".docx": self.open_docx,
+            ".pdf": self.open_pdf,
+        }
+        self._image_lru = OrderedDict()  # id(PhotoImage) -> (PhotoImage, embedded image name), oldest first
+        self._known_tags = set()  # Color tags already configured in the text area
         self.current_file_type = "text"  # Current document type (text/csv/docx/pdf)
 
         # CSV-specific data storage
         self.csv_data = []  # Raw CSV data rows
         self.csv_headers = []  # CSV column headers
 
+        # PDF viewer state (pages render off the Tk thread, on demand)
+        self._pdf_executor = ThreadPoolExecutor(max_workers=1)
+        self._pdf_path = None  # PDF currently shown in the viewer
+        self._pdf_canvas = None  # Scrollable canvas holding the pages
+        self._pdf_slots = []  # One placeholder frame per page
+        self._pdf_pending = {}  # Page number -> render future
+        self._pdf_page_cache = OrderedDict()  # Page number -> (PhotoImage, Label), LRU order
+        self._pdf_photo_pool = []  # PhotoImages of evicted pages, reused for new ones
+        self._pdf_refresh_job = None  # Pending visible-page check
+        self._pdf_text_pages = None  # Queue of extracted page texts (text-only fallback)
+        self._pdf_text_stop = None  # Event that stops an in-progress text extraction
+
+        # Status bar statistics are recomputed at most once per STATUS_DELAY_MS
+        self._status_job = None
+        self._line_words = [0]  # Word count of each text area line (index 0 = line 1)
+        self._word_total = 0  # Sum of _line_words
+        self._dirty_lines = []  # (first, last) line ranges edited since the last word count
+        self._char_total = 0  # Characters in the text area, kept up to date by every edit
+
         # Apply custom styling
         self.apply_custom_styles()
 
@@ -69,13 +141,18 @@ class ModernEditorApp:
         self.create_main_area()
         self.create_status_bar()
 
-        # Register keyboard shortcuts
-        self.root.bind("<Control-s>", lambda e: self.save_file())
-        self.root.bind("<Control-o>", lambda e: self.open_file())
-        self.root.bind("<Control-n>", lambda e: self.new_file())
-        self.root.bind("<Control-b>", lambda e: self.apply_bold())
-        self.root.bind("<Control-i>", lambda e: self.apply_italic())
-        self.root.bind("<Control-u>", lambda e: self.apply_underline())
+        # Register keyboard shortcuts (the actions take the event directly,
+        # so no wrapper lambda runs on each key press)
+        shortcuts = [
+            ("<Control-s>", self.save_file),
+            ("<Control-o>", self.open_file),
+            ("<Control-n>", self.new_file),
+            ("<Control-b>", self.apply_bold),
+            ("<Control-i>", self.apply_italic),
+            ("<Control-u>", self.apply_underline),
+        ]
+        for sequence, action in shortcuts:
+            self.root.bind(sequence, action)
 
         # Handle window close event
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
@@ -136,22 +213,29 @@ class ModernEditorApp:
         # Visual separator
         ttk.Separator(self.sidebar, bootstyle="secondary").pack(fill=X, padx=25, pady=15)
 
-        # === FILE OPERATIONS SECTION ===
-        self.create_section_header("FILE OPERATIONS")
-        self.create_sidebar_button("📄  New Document", self.new_file, "success")
-        self.create_sidebar_button("📂  Open File", self.open_file, "info")
-        self.create_sidebar_button("💾  Save", self.save_file, "primary")
-        self.create_sidebar_button("💾  Save As", self.save_as_file, "primary")
-
-        # === INSERT CONTENT SECTION ===
-        self.create_section_header("INSERT CONTENT")
-        self.create_sidebar_button("🖼️  Insert Image", self.insert_image, "warning")
-        self.create_sidebar_button("📊  CSV Table", self.create_csv_table, "info")
-
-        # === EXPORT OPTIONS SECTION ===
-        self.create_section_header("EXPORT OPTIONS")
-        self.create_sidebar_button("📄  Export DOCX", self.export_to_docx, "danger")
-        self.create_sidebar_button("📕  Export PDF", self.export_to_pdf, "danger")
+        # === ACTION SECTIONS ===
+        # (section header, [(button text, command, bootstyle), ...])
+        sections = [
+            ("FILE OPERATIONS", [
+                ("📄  New Document", self.new_file, "success"),
+                ("📂  Open File", self.open_file, "info"),
+                ("💾  Save", self.save_file, "primary"),
+                ("💾  Save As", self.save_as_file, "primary"),
+            ]),
+            ("INSERT CONTENT", [
+                ("🖼️  Insert Image", self.insert_image, "warning"),
+                ("📊  CSV Table", self.create_csv_table, "info"),
+            ]),
+            ("EXPORT OPTIONS", [
+                ("📄  Export DOCX", self.export_to_docx, "danger"),
+                ("📕  Export PDF", self.export_to_pdf, "danger"),
+            ]),
+        ]
+
+        for header, buttons in sections:
+            self.create_section_header(header)
+            for text, command, style in buttons:
+                self.create_sidebar_button(text, command, style)
 
         # === FOOTER ===
         footer = ttk.Frame(self.sidebar, bootstyle="dark")
@@ -231,11 +315,23 @@ class ModernEditorApp:
         self.text_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.text_frame, text="✏️  Text Editor")
 
+        # Named fonts are shared by reference: change_font reconfigures them
+        # in place and the text area and every tag using them update automatically
+        self._fonts = {
+            "base": tkfont.Font(family="Segoe UI", size=12),
+            "bold": tkfont.Font(family="Segoe UI", size=12, weight="bold"),
+            "italic": tkfont.Font(family="Segoe UI", size=12, slant="italic"),
+            "underline": tkfont.Font(family="Segoe UI", size=12, underline=True),
+            "heading1": tkfont.Font(family="Segoe UI", size=32, weight="bold"),
+            "heading2": tkfont.Font(family="Segoe UI", size=24, weight="bold"),
+            "heading3": tkfont.Font(family="Segoe UI", size=18, weight="bold"),
+        }
+
         # Main text widget with modern styling
         self.text_area = Text(
             self.text_frame,
             wrap="word",  # Word wrapping
-            font=("Segoe UI", 12),
+            font=self._fonts["base"],
             bg="#FFFFFF",
             fg="#1A1A1A",
             insertbackground="#3498DB",  # Cursor color
@@ -257,25 +353,99 @@ class ModernEditorApp:
 
         # === TEXT FORMATTING TAGS ===
         # Configure custom text styles
-        self.text_area.tag_configure("bold", font=("Segoe UI", 12, "bold"))
-        self.text_area.tag_configure("italic", font=("Segoe UI", 12, "italic"))
-        self.text_area.tag_configure("underline", font=("Segoe UI", 12, "underline"))
-        self.text_area.tag_configure("heading1", font=("Segoe UI", 32, "bold"), foreground="#E74C3C", spacing3=15)
-        self.text_area.tag_configure("heading2", font=("Segoe UI", 24, "bold"), foreground="#3498DB", spacing3=12)
-        self.text_area.tag_configure("heading3", font=("Segoe UI", 18, "bold"), foreground="#16A085", spacing3=10)
+        self.text_area.tag_configure("bold", font=self._fonts["bold"])
+        self.text_area.tag_configure("italic", font=self._fonts["italic"])
+        self.text_area.tag_configure("underline", font=self._fonts["underline"])
+        self.text_area.tag_configure("heading1", font=self._fonts["heading1"], foreground="#E74C3C", spacing3=15)
+        self.text_area.tag_configure("heading2", font=self._fonts["heading2"], foreground="#3498DB", spacing3=12)
+        self.text_area.tag_configure("heading3", font=self._fonts["heading3"], foreground="#16A085", spacing3=10)
+
+        # Tag toggling runs entirely in Tcl: one call instead of a tag_names
+        # lookup followed by tag_add/tag_remove. Does nothing without a selection.
+        self.root.tk.eval(
+            "proc toggle_tag {w tag} {\n"
+            "    if {[catch {$w tag ranges sel} r] || [llength $r] == 0} return\n"
+            "    if {[lsearch -exact [$w tag names sel.first] $tag] >= 0} {\n"
+            "        $w tag remove $tag sel.first sel.last\n"
+            "    } else {\n"
+            "        $w tag add $tag sel.first sel.last\n"
+            "    }\n"
+            "}"
+        )
+
+        # Every edit (typing, paste, undo, loading a file) goes through the widget's
+        # Tcl command, so wrap that command to report which lines each edit touched
+        # and how many characters it added or removed there.
+        # Errors stay in Tcl, exactly as if the widget had been called directly.
+        self.root.tk.eval(
+            "proc track_text_edits {widget notify op args} {\n"
+            "    if {$op ni {insert delete replace} || [llength $args] == 0} {\n"
+            "        return [uplevel 1 [list $widget $op {*}$args]]\n"
+            "    }\n"
+            "    switch -- $op {\n"
+            "        insert {set indices [lrange $args 0 0]}\n"
+            "        replace {set indices [lrange $args 0 1]}\n"
+            "        default {\n"
+            "            set indices $args\n"
+            "            if {[llength $args] == 1} {lappend indices \"[lindex $args 0] +1c\"}\n"
+            "        }\n"
+            "    }\n"
+            "    set end [lindex [split [$widget index end-1c] .] 0]\n"
+            "    set lines {}\n"
+            "    foreach index $indices {\n"
+            "        set line [lindex [split [$widget index $index] .] 0]\n"
+            "        lappend lines [expr {min($line, $end)}]\n"
+            "    }\n"
+            "    set first [tcl::mathfunc::min {*}$lines]\n"
+            "    set last [tcl::mathfunc::max {*}$lines]\n"
+            "    set chars [$widget count -chars $first.0 \"$last.0 lineend\"]\n"
+            "    set result [uplevel 1 [list $widget $op {*}$args]]\n"
+            "    set delta [expr {[lindex [split [$widget index end-1c] .] 0] - $end}]\n"
+            "    set after [$widget count -chars $first.0 \"[expr {$last + $delta}].0 lineend\"]\n"
+            "    $notify $first $last $delta [expr {$after - $chars}]\n"
+            "    return $result\n"
+            "}"
+        )
+        text_command = str(self.text_area)
+        self.root.tk.call("rename", text_command, text_command + "_tracked")
+        self.root.tk.call(
+            "interp", "alias", "", text_command, "", "track_text_edits",
+            text_command + "_tracked", self.root.register(self._on_lines_edited)
+        )
 
         # Bind events for tracking changes and updating status
+        # (every edit raises <<Modified>>, so keys that only move the cursor
+        # or select text no longer trigger a recount)
         self.text_area.bind("<<Modified>>", self.on_text_change)
-        self.text_area.bind("<KeyRelease>", self.update_status)
 
         # === CSV TABLE TAB ===
         self.csv_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.csv_frame, text="📊  CSV Table")
+        self.csv_table = None  # Tableview is created on the first CSV open and reused
 
         # === PDF VIEWER TAB ===
         self.pdf_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.pdf_frame, text="📕  PDF Viewer")
+        self.pdf_text = None  # Created the first time the tab is shown
+
+        # Tab contents beyond the editor are built on first use
+        self._built_tabs = set()
+        self.notebook.bind("<<NotebookTabChanged>>", self._ensure_tab_built)
+
+    def _ensure_tab_built(self, event=None):
+        """
+        Build a tab's widgets the first time it is selected.
+        Most sessions only edit text, so the PDF viewer is not created up front.
+
+        Args:
+            event: Tkinter event object (optional)
+        """
+        if self.notebook.select() == str(self.pdf_frame) and "pdf" not in self._built_tabs:
+            self._built_tabs.add("pdf")
+            self._build_pdf_tab()
 
+    def _build_pdf_tab(self):
+        """Create the read-only text view shown in the PDF tab."""
         # Read-only text widget for PDF content
         self.pdf_text = Text(
             self.pdf_frame,
@@ -344,113 +514,45 @@ class ModernEditorApp:
         )
         size_spinbox.pack(side=LEFT, padx=2)
 
-        # === TEXT STYLE CARD ===
-        style_card = ttk.Labelframe(
-            toolbar,
-            text="  Style  ",
-            bootstyle="success",
-            padding=15
-        )
-        style_card.pack(side=LEFT, padx=5)
-
-        # Bold button
-        btn_bold = ttk.Button(
-            style_card,
-            text="𝐁",
-            bootstyle="success-outline",
-            command=self.apply_bold,
-            width=4,
-            cursor="hand2"
-        )
-        btn_bold.pack(side=LEFT, padx=2)
-
-        # Italic button
-        btn_italic = ttk.Button(
-            style_card,
-            text="𝐼",
-            bootstyle="success-outline",
-            command=self.apply_italic,
-            width=4,
-            cursor="hand2"
-        )
-        btn_italic.pack(side=LEFT, padx=2)
-
-        # Underline button
-        btn_underline = ttk.Button(
-            style_card,
-            text="U̲",
-            bootstyle="success-outline",
-            command=self.apply_underline,
-            width=4,
-            cursor="hand2"
-        )
-        btn_underline.pack(side=LEFT, padx=2)
-
-        # === HEADING CARD ===
-        heading_card = ttk.Labelframe(
-            toolbar,
-            text="  Headings  ",
-            bootstyle="info",
-            padding=15
-        )
-        heading_card.pack(side=LEFT, padx=5)
-
-        # H1, H2, H3 buttons with different color styles
-        ttk.Button(
-            heading_card,
-            text="H1",
-            bootstyle="danger",
-            command=lambda: self.apply_heading("heading1"),
-            width=4,
-            cursor="hand2"
-        ).pack(side=LEFT, padx=2)
-
-        ttk.Button(
-            heading_card,
-            text="H2",
-            bootstyle="primary",
-            command=lambda: self.apply_heading("heading2"),
-            width=4,
-            cursor="hand2"
-        ).pack(side=LEFT, padx=2)
-
-        ttk.Button(
-            heading_card,
-            text="H3",
-            bootstyle="success",
-            command=lambda: self.apply_heading("heading3"),
-            width=4,
-            cursor="hand2"
-        ).pack(side=LEFT, padx=2)
-
-        # === COLOR CARD ===
-        color_card = ttk.Labelframe(
-            toolbar,
-            text="  Colors  ",
-            bootstyle="warning",
-            padding=15
-        )
-        color_card.pack(side=LEFT, padx=5)
-
-        # Text color button
-        ttk.Button(
-            color_card,
-            text="🎨 Text",
-            bootstyle="warning",
-            command=self.change_text_color,
-            width=9,
-            cursor="hand2"
-        ).pack(side=LEFT, padx=2)
-
-        # Background color button
-        ttk.Button(
-            color_card,
-            text="🎨 BG",
-            bootstyle="warning-outline",
-            command=self.change_bg_color,
-            width=8,
-            cursor="hand2"
-        ).pack(side=LEFT, padx=2)
+        # === STYLE, HEADING AND COLOR CARDS ===
+        # (card title, card bootstyle, [(button text, command, bootstyle, width), ...])
+        cards = [
+            ("  Style  ", "success", [
+                ("𝐁", self.apply_bold, "success-outline", 4),
+                ("𝐼", self.apply_italic, "success-outline", 4),
+                ("U̲", self.apply_underline, "success-outline", 4),
+            ]),
+            # H1, H2, H3 buttons with different color styles
+            ("  Headings  ", "info", [
+                ("H1", lambda: self.apply_heading("heading1"), "danger", 4),
+                ("H2", lambda: self.apply_heading("heading2"), "primary", 4),
+                ("H3", lambda: self.apply_heading("heading3"), "success", 4),
+            ]),
+            # Text and background color buttons
+            ("  Colors  ", "warning", [
+                ("🎨 Text", self.change_text_color, "warning", 9),
+                ("🎨 BG", self.change_bg_color, "warning-outline", 8),
+            ]),
+        ]
+
+        for title, card_style, buttons in cards:
+            card = ttk.Labelframe(
+                toolbar,
+                text=title,
+                bootstyle=card_style,
+                padding=15
+            )
+            card.pack(side=LEFT, padx=5)
+
+            for text, command, style, width in buttons:
+                ttk.Button(
+                    card,
+                    text=text,
+                    bootstyle=style,
+                    command=command,
+                    width=width,
+                    cursor="hand2"
+                ).pack(side=LEFT, padx=2)
 
     def create_status_bar(self):
         """
@@ -484,41 +586,33 @@ class ModernEditorApp:
     # TEXT FORMATTING METHODS
     # =========================================================================
 
-    def apply_bold(self):
+    def apply_bold(self, event=None):
         """
         Toggle bold formatting on selected text.
         If text is already bold, removes bold; otherwise applies bold.
+
+        Args:
+            event: Tkinter event object (optional, set when called from a shortcut)
         """
-        try:
-            current_tags = self.text_area.tag_names("sel.first")
-            if "bold" in current_tags:
-                self.text_area.tag_remove("bold", "sel.first", "sel.last")
-            else:
-                self.text_area.tag_add("bold", "sel.first", "sel.last")
-        except:
-            pass  # No selection
+        self.root.tk.call("toggle_tag", self.text_area._w, "bold")
 
-    def apply_italic(self):
-        """Toggle italic formatting on selected text."""
-        try:
-            current_tags = self.text_area.tag_names("sel.first")
-            if "italic" in current_tags:
-                self.text_area.tag_remove("italic", "sel.first", "sel.last")
-            else:
-                self.text_area.tag_add("italic", "sel.first", "sel.last")
-        except:
-            pass  # No selection
+    def apply_italic(self, event=None):
+        """
+        Toggle italic formatting on selected text.
 
-    def apply_underline(self):
-        """Toggle underline formatting on selected text."""
-        try:
-            current_tags = self.text_area.tag_names("sel.first")
-            if "underline" in current_tags:
-                self.text_area.tag_remove("underline", "sel.first", "sel.last")
-            else:
-                self.text_area.tag_add("underline", "sel.first", "sel.last")
-        except:
-            pass  # No selection
+        Args:
+            event: Tkinter event object (optional, set when called from a shortcut)
+        """
+        self.root.tk.call("toggle_tag", self.text_area._w, "italic")
+
+    def apply_underline(self, event=None):
+        """
+        Toggle underline formatting on selected text.
+
+        Args:
+            event: Tkinter event object (optional, set when called from a shortcut)
+        """
+        self.root.tk.call("toggle_tag", self.text_area._w, "underline")
 
     def apply_heading(self, heading_tag):
         """
@@ -543,18 +637,20 @@ class ModernEditorApp:
         Called when user changes font dropdown or size spinner.
         """
         family = self.font_family_var.get()
-        size = self.font_size_var.get()
+        try:
+            size = self.font_size_var.get()
+        except TclError:
+            return  # Size box holds a partial or non-numeric entry
 
-        # Update base font
-        self.text_area.configure(font=(family, size))
+        # Nothing to do if the spinner was nudged back to the current value
+        base = self._fonts["base"]
+        if base.cget("family") == family and int(base.cget("size")) == size:
+            return
 
-        # Update all formatting tag fonts
-        self.text_area.tag_configure("bold", font=(family, size, "bold"))
-        self.text_area.tag_configure("italic", font=(family, size, "italic"))
-        self.text_area.tag_configure("underline", font=(family, size, "underline"))
-        self.text_area.tag_configure("heading1", font=(family, size + 20, "bold"))
-        self.text_area.tag_configure("heading2", font=(family, size + 12, "bold"))
-        self.text_area.tag_configure("heading3", font=(family, size + 6, "bold"))
+        # Reconfigure the shared fonts in place (the text area and tags hold
+        # them by reference, so nothing needs re-assigning)
+        for name, offset in self.FONT_SIZE_OFFSETS.items():
+            self._fonts[name].configure(family=family, size=size + offset)
 
     def change_text_color(self):
         """
@@ -565,7 +661,9 @@ class ModernEditorApp:
             color = colorchooser.askcolor(title="Choose Text Color")
             if color[1]:  # color[1] is hex value
                 tag_name = f"color_{color[1]}"
-                self.text_area.tag_configure(tag_name, foreground=color[1])
+                if tag_name not in self._known_tags:  # Configure each color once
+                    self.text_area.tag_configure(tag_name, foreground=color[1])
+                    self._known_tags.add(tag_name)
                 self.text_area.tag_add(tag_name, "sel.first", "sel.last")
         except:
             pass  # No selection or dialog cancelled
@@ -579,7 +677,9 @@ class ModernEditorApp:
             color = colorchooser.askcolor(title="Choose Background Color")
             if color[1]:
                 tag_name = f"bg_{color[1]}"
-                self.text_area.tag_configure(tag_name, background=color[1])
+                if tag_name not in self._known_tags:  # Configure each color once
+                    self.text_area.tag_configure(tag_name, background=color[1])
+                    self._known_tags.add(tag_name)
                 self.text_area.tag_add(tag_name, "sel.first", "sel.last")
         except:
             pass  # No selection or dialog cancelled
@@ -595,32 +695,33 @@ class ModernEditorApp:
         """
         filepath = filedialog.askopenfilename(
             title="Select Image",
-            filetypes=[("Image Files", "*.png *.jpg *.jpeg *.gif *.bmp"), ("All Files", "*.*")]
+            filetypes=[("Image Files", "*.png *.jpg *.jpeg *.gif *.bmp"), ("All Files", "*.*")],
+            initialdir=self._last_open_dir
         )
 
         if filepath:
+            self._last_open_dir = os.path.dirname(filepath)
             try:
                 img = Image.open(filepath)
                 max_width = 700
 
-                # Resize if image is too wide
+                # Shrink in place if image is too wide (keeps aspect ratio, never enlarges).
+                # reducing_gap lets PIL box-reduce first and only run LANCZOS on the last step
                 if img.width > max_width:
-                    ratio = max_width / img.width
-                    new_height = int(img.height * ratio)
                     # Use appropriate resampling method (newer PIL versions use Image.Resampling)
                     try:
                         resample = Image.Resampling.LANCZOS
                     except AttributeError:
                         resample = Image.LANCZOS
-                    img = img.resize((max_width, new_height), resample)
+                    img.thumbnail((max_width, img.height), resample, reducing_gap=3.0)
 
-                # Convert to PhotoImage and store reference
+                # Convert to PhotoImage
                 photo = ImageTk.PhotoImage(img)
-                self.images.append(photo)  # Prevent garbage collection
 
-                # Insert image at cursor position
-                self.text_area.image_create("insert", image=photo)
+                # Insert image at cursor position and keep a reference
+                image_name = self.text_area.image_create("insert", image=photo)
                 self.text_area.insert("insert", "\n")
+                self._remember_image(photo, image_name)
 
                 # Mark as unsaved
                 self.is_saved = False
@@ -628,6 +729,25 @@ class ModernEditorApp:
             except Exception as e:
                 messagebox.showerror("Error", f"Could not insert image:\n{e}")
 
+    def _remember_image(self, photo, image_name):
+        """
+        Keep a reference to an inserted image so it is not garbage collected.
+        Once more than MAX_IMAGES are held, references to images that have
+        since been deleted from the text are dropped so Tk can release their
+        pixmaps. Images still in the document are always kept, otherwise they
+        would go blank and be lost on save.
+
+        Args:
+            photo: PhotoImage shown in the text area
+            image_name: Name of the embedded image returned by image_create
+        """
+        self._image_lru[id(photo)] = (photo, image_name)
+        if len(self._image_lru) > self.MAX_IMAGES:
+            embedded = set(self.text_area.image_names())
+            for key, (_, name) in list(self._image_lru.items()):
+                if name not in embedded:
+                    del self._image_lru[key]
+
     # =========================================================================
     # CSV HANDLING METHODS
     # =========================================================================
@@ -650,38 +770,35 @@ class ModernEditorApp:
             filepath: Path to the CSV file to open
         """
         try:
-            with open(filepath, 'r', encoding='utf-8') as file:
-                csv_reader = csv.reader(file)
-                self.csv_data = list(csv_reader)
+            # First row becomes headers
+            self.csv_headers, rowdata = _read_csv_rows(filepath)
+            self.csv_data = [self.csv_headers, *rowdata]  # Raw rows, kept for saving
 
-                if self.csv_data:
-                    # First row becomes headers
-                    self.csv_headers = self.csv_data[0]
+            if self.csv_headers:
+                # Prepare column definitions
+                coldata = [{"text": header, "stretch": True} for header in self.csv_headers]
 
-                    # Clear any existing table
-                    for widget in self.csv_frame.winfo_children():
-                        widget.destroy()
-
-                    # Prepare column definitions
-                    coldata = [{"text": header, "stretch": True} for header in self.csv_headers]
-                    rowdata = self.csv_data[1:]  # All rows except header
-
-                    # Create table widget
-                    table = Tableview(
+                if self.csv_table is None:
+                    # Create table widget once; later opens only swap its data
+                    self.csv_table = Tableview(
                         self.csv_frame,
                         coldata=coldata,
                         rowdata=rowdata,
-                        paginated=True,  # Enable pagination
+                        paginated=True,  # Only the current page goes into the treeview
+                        pagesize=self.CSV_PAGE_SIZE,
                         searchable=True,  # Enable search functionality
                         bootstyle="primary",
                         height=20
                     )
-                    table.pack(fill=BOTH, expand=True, padx=20, pady=20)
+                    self.csv_table.pack(fill=BOTH, expand=True, padx=20, pady=20)
+                else:
+                    # Replaces columns and rows in place (purges the old data first)
+                    self.csv_table.build_table_data(coldata=coldata, rowdata=rowdata)
 
-                    # Switch to CSV tab
-                    self.notebook.select(1)
-                    self.current_file_type = "csv"
-                    self.file_type_label.config(text="📊 CSV Table")
+                # Switch to CSV tab
+                self.notebook.select(1)
+                self.current_file_type = "csv"
+                self.file_type_label.config(text="📊 CSV Table")
         except Exception as e:
             messagebox.showerror("Error", f"Could not open CSV:\n{e}")
 
@@ -698,12 +815,12 @@ class ModernEditorApp:
             filepath: Path to the DOCX file
         """
         try:
-            doc = Document(filepath)
+            # Extract all paragraphs as plain text and insert them in one call
+            # (one Tcl round-trip and re-wrap instead of one per paragraph)
+            content = "\n".join(_read_docx_paragraphs(filepath)) + "\n"
             self.text_area.delete("1.0", END)
-
-            # Extract all paragraphs as plain text
-            for para in doc.paragraphs:
-                self.text_area.insert(END, para.text + "\n")
+            self.text_area.insert("1.0", content)
+            self.text_area.edit_modified(False)  # Freshly loaded, not a user edit
 
             self.notebook.select(0)  # Switch to text editor tab
             self.current_file_type = "docx"
@@ -712,118 +829,322 @@ class ModernEditorApp:
             messagebox.showerror("Error", f"Could not open DOCX:\n{e}")
 
     def open_pdf(self, filepath):
-        try:
-            from pdf2image import convert_from_path
-
-            # ⚠ Show "wait" window BEFORE freeze
-            wait_win = ttk.Toplevel(self)
-            wait_win.title("Loading PDF")
-            wait_win.geometry("320x120")
-            wait_win.resizable(False, False)
-
-            ttk.Label(
-                wait_win,
-                text="Please wait...\nThe editor may freeze while the PDF loads.",
-                font=("Segoe UI", 11),
-                justify="center"
-            ).pack(pady=15)
-
-            pbar = ttk.Progressbar(wait_win, mode="indeterminate", length=220)
-            pbar.pack(pady=5)
-            pbar.start(12)
-
-            # Force Tk to draw the window BEFORE freezing
-            wait_win.update()
-
-            # ----------------------------
-            #  The part that will freeze
-            # ----------------------------
-            pages = convert_from_path(filepath, dpi=300)
-
-            # Once loaded, close wait window
-            wait_win.destroy()
-
-            # ---- Your existing UI code ----
-            for widget in self.pdf_frame.winfo_children():
-                widget.destroy()
-
-            canvas = ttk.Canvas(self.pdf_frame, bg="#FAFAFA")
-            scrollbar = ttk.Scrollbar(
-                self.pdf_frame, orient="vertical",
-                command=canvas.yview, bootstyle="round"
-            )
-            scrollable_frame = ttk.Frame(canvas)
+        """
+        Open a PDF in the viewer tab.
+        Only the page count and size are read up front; each page is rasterized
+        on a worker thread when it scrolls into view, so the editor stays
+        responsive and memory use does not grow with the page count.
 
-            scrollable_frame.bind(
-                "<Configure>",
-                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-            )
+        Args:
+            filepath: Path to the PDF file
+        """
+        # Drop any pages still rendering for a previously opened PDF
+        self._cancel_pdf_render()
+        self._built_tabs.add("pdf")  # The viewer below replaces the tab contents
+        self.pdf_text = None
+
+        for widget in self.pdf_frame.winfo_children():
+            widget.destroy()
+
+        if _pdf_renderers() == (None, None):
+            # No page renderer installed; show the document's text instead
+            self._open_pdf_text(filepath)
+            return
 
-            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-            canvas.configure(yscrollcommand=scrollbar.set)
+        canvas = ttk.Canvas(self.pdf_frame, bg="#FAFAFA")
+        scrollbar = ttk.Scrollbar(
+            self.pdf_frame, orient="vertical",
+            command=canvas.yview, bootstyle="round"
+        )
+        pages_frame = ttk.Frame(canvas)
 
-            scrollbar.pack(side=RIGHT, fill=Y)
-            canvas.pack(side=LEFT, fill=BOTH, expand=True)
+        pages_frame.bind(
+            "<Configure>",
+            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        )
 
-            self._display_pdf_pages(pages, scrollable_frame, canvas, wait_win)
+        canvas.create_window((0, 0), window=pages_frame, anchor="nw")
 
-            self.notebook.select(2)
-            self.current_file_type = "pdf"
-            self.file_type_label.config(text="📕 PDF Document")
+        # Render whatever becomes visible whenever the view moves or resizes
+        def _on_yscroll(first, last):
+            scrollbar.set(first, last)
+            self._schedule_pdf_refresh()
 
-        except ImportError:
+        canvas.configure(yscrollcommand=_on_yscroll)
+        canvas.bind("<Configure>", lambda e: self._schedule_pdf_refresh())
+
+        scrollbar.pack(side=RIGHT, fill=Y)
+        canvas.pack(side=LEFT, fill=BOTH, expand=True)
+
+        # Mouse wheel scroll
+        def _on_mousewheel(event):
+            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+
+        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+
+        self._pdf_path = filepath
+        self._pdf_canvas = canvas
+        slots = self._pdf_slots
+        layout_future = self._pdf_executor.submit(_read_pdf_layout, filepath)
+        self._watch_pdf_future(
+            layout_future,
+            lambda layout: self._build_pdf_slots(slots, pages_frame, layout)
+        )
+
+        self.status_bar.config(text="📕 Loading PDF...  |  You can keep working while pages render")
+        self.notebook.select(2)
+        self.current_file_type = "pdf"
+        self.file_type_label.config(text="📕 PDF Document")
+
+    def _watch_pdf_future(self, future, callback):
+        """
+        Poll a PDF worker future from the Tk loop without blocking it.
+        Hands the result to callback on the Tk thread, or reports the error.
+
+        Args:
+            future: Future returned by the PDF render executor
+            callback: Function called with the future's result
+        """
+        if not future.done():
+            self.root.after(50, self._watch_pdf_future, future, callback)
+            return
+
+        if future.cancelled():
+            return
+
+        try:
+            result = future.result()
+        except ImportError as e:
             messagebox.showerror(
                 "Missing Dependency",
-                "PDF viewing requires 'pdf2image'. Install with:\npip install pdf2image"
+                f"PDF viewing requires '{e.name}'. Install with:\npip install {e.name}"
             )
+            return
         except Exception as e:
             messagebox.showerror("Error", f"Could not open PDF:\n{e}")
+            return
+
+        callback(result)
+
+    def _open_pdf_text(self, filepath):
+        """
+        Show a PDF as plain text in the PDF tab.
+        Pages are extracted on the PDF worker thread and appended as each
+        one finishes, so the first page shows up without waiting for the rest.
+
+        Args:
+            filepath: Path to the PDF file
+        """
+        self._build_pdf_tab()
+
+        pages = queue.Queue()
+        stop = threading.Event()
+        self._pdf_text_pages = pages
+        self._pdf_text_stop = stop
+        future = self._pdf_executor.submit(_extract_pdf_text, filepath, pages.put, stop)
+        self._watch_pdf_future(future, lambda result: None)  # Only reports errors
+        self._append_pdf_text(pages)
+
+        self.status_bar.config(text="📕 Loading PDF text...  |  You can keep working meanwhile")
+        self.notebook.select(2)
+        self.current_file_type = "pdf"
+        self.file_type_label.config(text="📕 PDF Document (text)")
+
+    def _append_pdf_text(self, pages):
+        """
+        Move page texts queued by the worker into the PDF text view.
+        Reschedules itself until the worker signals the end with None.
+
+        Args:
+            pages: Queue the extraction worker is filling
+        """
+        if pages is not self._pdf_text_pages:
+            return  # Superseded by another PDF
+
+        chunks = []
+        done = False
+        try:
+            while True:
+                chunk = pages.get_nowait()
+                if chunk is None:
+                    done = True
+                    break
+                chunks.append(chunk)
+        except queue.Empty:
+            pass
+
+        if chunks:
+            self.pdf_text.configure(state="normal")
+            self.pdf_text.insert(END, "".join(chunks))
+            self.pdf_text.configure(state="disabled")
+
+        if done:
+            self._pdf_text_pages = None
+            self.update_status()
+        else:
+            self.root.after(50, self._append_pdf_text, pages)
+
+    def _build_pdf_slots(self, slots, pages_frame, layout):
+        """
+        Reserve an empty, correctly sized placeholder for every page so the
+        scroll region matches the full document before anything is rendered.
 
-    def _display_pdf_pages(self, pages, scrollable_frame, canvas, loading_win):
-        loading_win.destroy()
+        Args:
+            slots: Placeholder list of the PDF being opened
+            pages_frame: Frame the placeholders are packed into
+            layout: (page count, page width, page height) in PDF points
+        """
+        if slots is not self._pdf_slots:
+            return  # Superseded by another PDF
 
-        for page_num, page_image in enumerate(pages, 1):
-            max_width = 800
-            if page_image.width > max_width:
-                ratio = max_width / page_image.width
-                new_height = int(page_image.height * ratio)
-                try:
-                    resample = Image.Resampling.LANCZOS
-                except AttributeError:
-                    resample = Image.LANCZOS
-                page_image = page_image.resize((max_width, new_height), resample)
+        page_count, width_pts, height_pts = layout
 
-            photo = ImageTk.PhotoImage(page_image)
-            self.images.append(photo)
+        # Size of a page once rendered and scaled to the viewer width
+        width = width_pts * self.PDF_DPI / 72
+        height = height_pts * self.PDF_DPI / 72
+        if width > self.PDF_PAGE_WIDTH:
+            height = height * self.PDF_PAGE_WIDTH / width
+            width = self.PDF_PAGE_WIDTH
 
-            lbl = ttk.Label(scrollable_frame,
+        for page_num in range(1, page_count + 1):
+            lbl = ttk.Label(pages_frame,
                             text=f"Page {page_num}",
                             font=("Segoe UI", 12, "bold"),
                             bootstyle="info")
             lbl.pack(pady=(20, 5))
 
-            img_label = ttk.Label(scrollable_frame, image=photo)
-            img_label.pack(pady=(0, 10))
+            slot = ttk.Frame(pages_frame, width=int(width), height=int(height))
+            slot.pack_propagate(False)  # Keep the reserved size while empty
+            slot.pack(pady=(0, 10))
+            slots.append(slot)
 
-            if page_num < len(pages):
-                ttk.Separator(scrollable_frame, bootstyle="secondary").pack(fill=X, padx=50, pady=10)
+            if page_num < page_count:
+                ttk.Separator(pages_frame, bootstyle="secondary").pack(fill=X, padx=50, pady=10)
 
-        # Mouse wheel scroll
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        self._schedule_pdf_refresh()
+        self.update_status()
 
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+    def _schedule_pdf_refresh(self):
+        """Coalesce scroll/resize events into one visible-page check."""
+        if self._pdf_refresh_job is None:
+            self._pdf_refresh_job = self.root.after(30, self._refresh_visible_pdf_pages)
 
-        self.notebook.select(2)
+    def _refresh_visible_pdf_pages(self):
+        """
+        Request rendering of every page intersecting the viewport, plus one
+        screen of look-ahead above and below it.
+        """
+        self._pdf_refresh_job = None
+        slots = self._pdf_slots
+        if not slots:
+            return
+
+        pages_frame = slots[0].master
+        pages_frame.update_idletasks()  # Make sure placeholder positions are current
+        total_height = pages_frame.winfo_height()
+        if total_height <= 1:
+            self._schedule_pdf_refresh()  # Not laid out yet
+            return
+
+        top, bottom = self._pdf_canvas.yview()
+        view_top = top * total_height
+        view_bottom = bottom * total_height
+        margin = view_bottom - view_top
+
+        for page_num, slot in enumerate(slots, 1):
+            slot_top = slot.winfo_y()
+            if slot_top + slot.winfo_reqheight() < view_top - margin or slot_top > view_bottom + margin:
+                continue
+
+            if page_num in self._pdf_page_cache:
+                self._pdf_page_cache.move_to_end(page_num)  # Recently seen
+            elif page_num not in self._pdf_pending:
+                future = self._pdf_executor.submit(_render_pdf_page, self._pdf_path, page_num, self.PDF_DPI)
+                self._pdf_pending[page_num] = future
+                self._watch_pdf_future(
+                    future,
+                    lambda page_image, n=page_num: self._show_pdf_page(slots, n, page_image)
+                )
+
+    def _show_pdf_page(self, slots, page_num, page_image):
+        """
+        Display a rendered page in its placeholder and evict the least
+        recently seen pages beyond the cache size.
+
+        Args:
+            slots: Placeholder list the page was rendered for
+            page_num: 1-based page number
+            page_image: Rendered PIL image of the page
+        """
+        if slots is not self._pdf_slots:
+            return  # Superseded by another PDF
+        self._pdf_pending.pop(page_num, None)
+
+        if page_image.width > self.PDF_PAGE_WIDTH:
+            try:
+                resample = Image.Resampling.LANCZOS
+            except AttributeError:
+                resample = Image.LANCZOS
+            page_image.thumbnail((self.PDF_PAGE_WIDTH, page_image.height), resample, reducing_gap=3.0)
+
+        photo = self._take_pdf_photo(page_image)
+
+        slot = slots[page_num - 1]
+        slot.configure(width=photo.width(), height=photo.height())  # Pages may differ in size
+        img_label = ttk.Label(slot, image=photo)
+        img_label.pack(fill=BOTH, expand=True)
+
+        self._pdf_page_cache[page_num] = (photo, img_label)
+        while len(self._pdf_page_cache) > self.PDF_PAGE_CACHE_SIZE:
+            _, (old_photo, old_label) = self._pdf_page_cache.popitem(last=False)
+            old_label.destroy()
+            # Keep the image buffer around for the next page of the same size
+            self._pdf_photo_pool.append(old_photo)
+            del self._pdf_photo_pool[:-self.PDF_PAGE_CACHE_SIZE]
+
+    def _take_pdf_photo(self, page_image):
+        """
+        Get a PhotoImage showing page_image, reusing a pooled buffer of the
+        same size via paste() instead of allocating a new Tk image.
+
+        Args:
+            page_image: PIL image of a rendered page
+
+        Returns:
+            ImageTk.PhotoImage displaying the page
+        """
+        for index, photo in enumerate(self._pdf_photo_pool):
+            if (photo.width(), photo.height()) == page_image.size:
+                del self._pdf_photo_pool[index]
+                photo.paste(page_image)
+                return photo
+
+        # No buffer of this size yet
+        return ImageTk.PhotoImage(page_image)
+
+    def _cancel_pdf_render(self):
+        """Forget the open PDF and cancel any pages still waiting to render."""
+        for future in self._pdf_pending.values():
+            future.cancel()
+        self._pdf_pending.clear()
+        if self._pdf_text_stop is not None:
+            self._pdf_text_stop.set()
+            self._pdf_text_stop = None
+        self._pdf_text_pages = None
+        self._pdf_page_cache.clear()
+        self._pdf_slots = []
 
     # =========================================================================
     # FILE OPERATION METHODS
     # =========================================================================
 
-    def new_file(self):
+    def new_file(self, event=None):
         """
         Create a new document, prompting to save if there are unsaved changes.
         Resets all document state variables.
+
+        Args:
+            event: Tkinter event object (optional, set when called from a shortcut)
         """
         # Check for unsaved changes
         if not self.is_saved:
@@ -835,19 +1156,24 @@ class ModernEditorApp:
 
         # Reset editor state
         self.text_area.delete("1.0", END)
-        self.images.clear()
+        self.text_area.edit_modified(False)  # Clearing is not a user edit
+        self._image_lru.clear()
         self.csv_data.clear()
-        self.filename = None
+        self._set_filename(None)
         self.is_saved = True
+        self.root.title(self._title)
         self.current_file_type = "text"
         self.file_type_label.config(text="📝 Text Document")
         self.notebook.select(0)
-        self.update_status()
+        self.schedule_status_update()
 
-    def open_file(self):
+    def open_file(self, event=None):
         """
         Open a file with auto-detection of format (TXT, CSV, DOCX, PDF).
         Routes to appropriate handler based on file extension.
+
+        Args:
+            event: Tkinter event object (optional, set when called from a shortcut)
         """
         filepath = filedialog.askopenfilename(
             defaultextension=".txt",
@@ -858,62 +1184,68 @@ class ModernEditorApp:
                 ("Word Documents", "*.docx"),
                 ("PDF Files", "*.pdf"),
                 ("All Files", "*.*")
-            ]
+            ],
+            initialdir=self._last_open_dir
         )
 
         if filepath:
-            self.filename = filepath
-            ext = os.path.splitext(filepath)[1].lower()
+            self._last_open_dir = os.path.dirname(filepath)
+            self._set_filename(filepath)
 
-            # Route to appropriate handler based on extension
-            if ext == '.csv':
-                self.open_csv(filepath)
-            elif ext == '.docx':
-                self.open_docx(filepath)
-            elif ext == '.pdf':
-                self.open_pdf(filepath)
-            else:
-                # Open as plain text
-                try:
-                    with open(filepath, "r", encoding="utf-8") as file:
-                        content = file.read()
-                        self.text_area.delete("1.0", END)
-                        self.text_area.insert("1.0", content)
-                        self.notebook.select(0)
-                        self.current_file_type = "text"
-                        self.file_type_label.config(text="📝 Text Document")
-                except Exception as e:
-                    messagebox.showerror("Error", f"Could not open file:\n{e}")
+            # Route to appropriate handler based on extension (plain text otherwise)
+            ext = os.path.splitext(filepath)[1].lower()
+            handler = self._open_handlers.get(ext, self.open_text)
+            handler(filepath)
 
             # Update window state
             self.is_saved = True
-            self.root.title(f"EduText - {os.path.basename(filepath)}")
-            self.update_status()
+            self.root.title(self._title)
+            self.schedule_status_update()
+
+    def open_text(self, filepath):
+        """
+        Open a file as plain text in the editor.
+
+        Args:
+            filepath: Path to the text file
+        """
+        try:
+            with open(filepath, "r", encoding="utf-8") as file:
+                self.text_area.delete("1.0", END)
+                # Insert in blocks so the file never sits in one big Python string
+                while chunk := file.read(self.OPEN_CHUNK_CHARS):
+                    self.text_area.insert(END, chunk)
+                self.text_area.edit_modified(False)  # Freshly loaded, not a user edit
+                self.notebook.select(0)
+                self.current_file_type = "text"
+                self.file_type_label.config(text="📝 Text Document")
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not open file:\n{e}")
 
-    def save_file(self):
+    def save_file(self, event=None):
         """
         Save the current document to disk.
         Handles different file types appropriately (CSV, DOCX, TXT).
         If no filename exists, prompts for Save As.
+
+        Args:
+            event: Tkinter event object (optional, set when called from a shortcut)
         """
         if self.filename:
             try:
                 # Save based on current file type
                 if self.current_file_type == "csv":
-                    with open(self.filename, 'w', newline='', encoding='utf-8') as file:
-                        writer = csv.writer(file)
-                        writer.writerows(self.csv_data)
+                    _write_csv_rows(self.filename, self.csv_data)
                 elif self.current_file_type == "docx":
                     self.save_as_docx(self.filename)
                 else:
-                    # Save as plain text
-                    content = self.text_area.get("1.0", "end-1c")
-                    with open(self.filename, "w", encoding="utf-8") as file:
-                        file.write(content)
+                    # Save as plain text, streamed from the widget a block at a time
+                    with _atomic_write(self.filename, "w", encoding="utf-8", buffering=1 << 20) as file:
+                        file.writelines(self._iter_text_chunks())
 
                 # Mark as saved
                 self.is_saved = True
-                self.root.title(f"EduText - {os.path.basename(self.filename)}")
+                self.root.title(self._title)
                 messagebox.showinfo("Success", "✅ File saved successfully!")
             except Exception as e:
                 messagebox.showerror("Error", f"Could not save file:\n{e}")
@@ -921,6 +1253,20 @@ class ModernEditorApp:
             # No filename set, prompt for Save As
             self.save_as_file()
 
+    def _iter_text_chunks(self):
+        """
+        Yield the editor's text in blocks of SAVE_CHUNK_LINES lines, so a
+        save never holds a second full copy of a large document in Python.
+
+        Returns:
+            generator: Consecutive pieces of the text, without the final newline
+        """
+        last_line = int(self.text_area.index("end-1c").split(".")[0])
+        for first in range(1, last_line + 1, self.SAVE_CHUNK_LINES):
+            stop = first + self.SAVE_CHUNK_LINES
+            end = f"{stop}.0" if stop <= last_line else "end-1c"
+            yield self.text_area.get(f"{first}.0", end)
+
     def save_as_file(self):
         """
         Prompt user for new filename and save document.
@@ -933,13 +1279,28 @@ class ModernEditorApp:
                 ("CSV Files", "*.csv"),
                 ("Word Documents", "*.docx"),
                 ("All Files", "*.*")
-            ]
+            ],
+            initialdir=self._last_save_dir
         )
 
         if filepath:
-            self.filename = filepath
+            self._last_save_dir = os.path.dirname(filepath)
+            self._set_filename(filepath)
             self.save_file()
 
+    def _set_filename(self, path):
+        """
+        Remember the current file and build its window title once.
+
+        Args:
+            path: Path of the open file, or None for a new document
+        """
+        self.filename = path
+        if path:
+            self._title = f"EduText - {os.path.basename(path)}"
+        else:
+            self._title = self.DEFAULT_TITLE
+
     # =========================================================================
     # EXPORT METHODS
     # =========================================================================
@@ -951,10 +1312,12 @@ class ModernEditorApp:
         """
         filepath = filedialog.asksaveasfilename(
             defaultextension=".docx",
-            filetypes=[("Word Documents", "*.docx")]
+            filetypes=[("Word Documents", "*.docx")],
+            initialdir=self._last_save_dir
         )
 
         if filepath:
+            self._last_save_dir = os.path.dirname(filepath)
             self.save_as_docx(filepath)
             messagebox.showinfo("Success", "✅ Exported to DOCX successfully!")
 
@@ -967,15 +1330,27 @@ class ModernEditorApp:
             filepath: Destination path for DOCX file
         """
         try:
-            doc = Document()
-            content = self.text_area.get("1.0", "end-1c")
+            # python-docx takes ~75 ms to import, so only load it when exporting
+            from docx import Document
+            from docx.oxml import OxmlElement
+            from docx.text.paragraph import Paragraph
 
-            # Add each line as a paragraph
-            for line in content.split("\n"):
-                if line.strip():  # Only add non-empty lines
-                    doc.add_paragraph(line)
+            doc = Document()
 
-            doc.save(filepath)
+            # Build paragraph elements directly and slot each one in front of
+            # the section properties. doc.add_paragraph() searches the body for
+            # that spot on every call, which makes long documents quadratic.
+            sect_pr = doc.element.body.sectPr
+            # Blocks always end on a line boundary, so no line is split between two
+            for block in self._iter_text_chunks():
+                for line in block.split("\n"):
+                    if line.strip():  # Only add non-empty lines
+                        paragraph = OxmlElement("w:p")
+                        Paragraph(paragraph, doc).add_run(line)  # Same run markup as add_paragraph
+                        sect_pr.addprevious(paragraph)
+
+            with _atomic_write(filepath, "wb") as file:
+                doc.save(file)
         except Exception as e:
             messagebox.showerror("Error", f"Could not export to DOCX:\n{e}")
 
@@ -1006,20 +1381,33 @@ class ModernEditorApp:
             event: Tkinter event object (optional)
         """
         if self.text_area.edit_modified():
-            self.is_saved = False
-            self.update_title()
+            if self.is_saved:  # Title only changes on the first edit
+                self.is_saved = False
+                self.update_title()
             self.text_area.edit_modified(False)  # Reset modified flag
+            self.schedule_status_update()
 
     def update_title(self):
         """
         Update window title to reflect unsaved changes.
         Adds bullet point (•) indicator when document has unsaved changes.
         """
-        title = self.root.title().rstrip(" •")
         if not self.is_saved:
-            # Add unsaved indicator
-            if not title.endswith(" •"):
-                self.root.title(title + " •")
+            # Add unsaved indicator to the cached title (no read back from Tk)
+            self.root.title(self._title + " •")
+
+    def schedule_status_update(self, event=None):
+        """
+        Refresh the status bar once typing pauses.
+        Restarts a short timer on every call, so bursts of keystrokes or
+        modifications cost a single recount instead of one each.
+
+        Args:
+            event: Tkinter event object (optional)
+        """
+        if self._status_job is not None:
+            self.root.after_cancel(self._status_job)
+        self._status_job = self.root.after(self.STATUS_DELAY_MS, self.update_status)
 
     def update_status(self, event=None):
         """
@@ -1029,15 +1417,75 @@ class ModernEditorApp:
         Args:
             event: Tkinter event object (optional)
         """
-        content = self.text_area.get("1.0", "end-1c")
-        lines = content.count("\n") + 1
-        chars = len(content)
-        words = len(content.split()) if content.strip() else 0
+        if self._status_job is not None:
+            self.root.after_cancel(self._status_job)
+            self._status_job = None
+
+        # All three counts are kept up to date edit by edit (see _on_lines_edited),
+        # so a refresh never walks the whole document
+        lines = len(self._line_words)
+        chars = self._char_total
+        words = self._count_words()
 
         self.status_bar.config(
             text=f"📄 Lines: {lines}  |  Characters: {chars}  |  Words: {words}  |  ✓ Ready"
         )
 
+    def _on_lines_edited(self, first, last, delta, chars):
+        """
+        Record an edit reported by the text widget's command wrapper.
+        Lines first..last (numbered as before the edit) became
+        first..last+delta: their word counts are reset until the next count,
+        and the pending ranges after them move with the edit. The character
+        total is adjusted right away. When Tk widens a delete back over the
+        newline before it (deleting to "end" from the start of a line),
+        last+delta is first-1: the line is simply gone and nothing is left
+        to recount.
+
+        Args:
+            first: First line the edit touched
+            last: Last line the edit touched
+            delta: Change in the document's line count
+            chars: Change in the document's character count
+        """
+        first, last, delta = int(first), int(last), int(delta)
+        self._char_total += int(chars)
+        self._word_total -= sum(self._line_words[first - 1:last])
+        self._line_words[first - 1:last] = [0] * (last + delta - first + 1)
+
+        edited_first, edited_last = first, last + delta
+        ranges = []
+        for range_first, range_last in self._dirty_lines:
+            if range_first > last:
+                ranges.append((range_first + delta, range_last + delta))
+            elif range_last < first:
+                ranges.append((range_first, range_last))
+            else:  # Overlaps this edit, so the two are recounted together
+                edited_first = min(edited_first, range_first)
+                edited_last = max(edited_last, range_last + delta)
+        if edited_first <= edited_last:
+            ranges.append((edited_first, edited_last))
+        self._dirty_lines = ranges
+
+    def _count_words(self):
+        """
+        Count the words in the editor. Only the lines edited since the last
+        count are read back from Tk and scanned; every other line keeps its
+        count in _line_words, so the cost follows the size of the edits, not
+        of the document.
+
+        Returns:
+            int: Number of whitespace-separated words
+        """
+        for first, last in self._dirty_lines:
+            text = self.text_area.get(f"{first}.0", f"{last}.end")
+            # Count matches lazily rather than building a list of every word
+            counts = [sum(1 for _ in _WORD_RE.finditer(line)) for line in text.split("\n")]
+            self._word_total += sum(counts) - sum(self._line_words[first - 1:last])
+            self._line_words[first - 1:last] = counts
+        self._dirty_lines = []
+        return self._word_total
+
     def on_closing(self):
         """
         Handle window close event.
@@ -1049,6 +1497,8 @@ class ModernEditorApp:
                 return  # User cancelled, don't close
             elif response:
                 self.save_file()
+        self._cancel_pdf_render()
+        self._pdf_executor.shutdown(wait=False)
         self.root.destroy()
 
 
@@ -1073,6 +1523,11 @@ class StartingWindow(Toplevel):
     Features: Draggable window, custom styling, no title bar.
     """
 
+    # Button labels; the clicked one is returned as result
+    MAIL_MERGE = "📧Mail Merge"
+    TEXT_EDITOR = "📝Text Editor"
+    EXIT = "❌Exit"
+
     def __init__(self):
         """Initialize the starting window with logo and option buttons."""
         super().__init__()
@@ -1089,7 +1544,7 @@ class StartingWindow(Toplevel):
         self.place_window_center()
 
         # Display logo
-        self.photo = PhotoImage(file="logo.png")
+        self.photo = _cached_photo("logo.png")
         image_label = Label(self, image=self.photo)
         image_label.place(x=250, y=45)
 
@@ -1102,7 +1557,7 @@ class StartingWindow(Toplevel):
         text2.pack(side="bottom", pady=20)
 
         # Option buttons
-        buttons = ["📧Mail Merge", "📝Text Editor", "❌Exit"]
+        buttons = [self.MAIL_MERGE, self.TEXT_EDITOR, self.EXIT]
 
         # Bottom button bar
         bottom_frame = ttk.Frame(self)
@@ -1117,7 +1572,7 @@ class StartingWindow(Toplevel):
         self.bind("<Button-1>", self.start_move)
         self.bind("<B1-Motion>", self.do_move)
 
-        self.mainloop()
+        self.wait_window(self)  # Block until finish() destroys the dialog
 
     def start_move(self, event):
         """Record initial mouse position for dragging."""
@@ -1141,148 +1596,167 @@ class StartingWindow(Toplevel):
         """
         self.result = value
         self.destroy()
-        self.quit()
 
 
-class CustomBox(Toplevel):
+class _BaseDialog(Toplevel):
     """
-    Custom message box with draggable interface.
-    Used for displaying messages with custom button options.
+    Frameless, draggable dialog shared by the mail merge prompts.
+    Builds the common layout (label image, message, bottom button bar)
+    in one place; subclasses only add their input widget through
+    _build_input() and read it back in _read_result().
+
+    Each dialog class keeps one window that is hidden between prompts, so
+    asking again only updates its message, buttons and input widget
+    instead of building a new window.
     """
 
-    def __init__(self, buttons, message, image_y):
+    GEOMETRY = "580x400"  # Window size
+    IMAGE_XY = (168, 40)  # Where label.png goes (None = not placed at build time)
+
+    _shared = None  # Per-class window reused by ask()
+
+    def __init__(self, *prompt_args, **prompt_kwargs):
         """
-        Initialize custom dialog box.
+        Build the dialog and show its first prompt.
 
         Args:
-            buttons: List of button labels
-            message: Message text to display
-            image_y: Y-coordinate for image placement
+            prompt_args: Positional arguments for prompt() (buttons, message, ...)
+            prompt_kwargs: Keyword arguments for prompt()
         """
         super().__init__()
-        self.result = None
+
+        self.result = None  # Answer read by _read_result()
+        self.choice = ""  # Stores which button was clicked
+        self._answered = ttk.BooleanVar(self)  # Set by finish() to end a prompt
+        self._button_labels = None  # Labels of the current buttons
+
+        # Input widget first, so the image and message sit above it
+        self._build_input()
 
         # Window configuration
-        self.geometry("480x350")
+        self.geometry(self.GEOMETRY)
         self.title("Mail Merge")
         self.resizable(True, True)
         self.attributes("-topmost", True)
         self.overrideredirect(True)  # Frameless window
 
         # Display label image
-        self.photo = PhotoImage(file="label.png")
-        image_label = Label(self, image=self.photo)
-        image_label.place(x=128, y=image_y)
+        self.photo = _cached_photo("label.png")
+        self.image_label = Label(self, image=self.photo)
+        if self.IMAGE_XY is not None:
+            self.image_label.place(x=self.IMAGE_XY[0], y=self.IMAGE_XY[1])
 
         # Bottom button bar
-        bottom_frame = ttk.Frame(self)
-        bottom_frame.place(relx=0, rely=1, anchor="sw", relwidth=1)
-
-        # Create buttons
-        for text in buttons:
-            btn1 = ttk.Button(bottom_frame, text=text, command=lambda v=text: self.finish(v))
-            btn1.pack(side="left", expand=True, fill="x", padx=5, pady=5)
-
-        # Message text
-        text = ttk.Label(self, text=message, font=("Segoe UI", 10))
-        text.pack(side="top", pady=15)
+        self.bottom_frame = ttk.Frame(self)
+        self.bottom_frame.place(relx=0, rely=1, anchor="sw", relwidth=1)
 
-        # Center window
-        self.place_window_center()
+        # Message label
+        self.message_label = ttk.Label(self, font=("Segoe UI", 10))
+        self._place_message()
 
         # Enable dragging
         self.bind("<Button-1>", self.start_move)
         self.bind("<B1-Motion>", self.do_move)
 
-        self.mainloop()
+        self.prompt(*prompt_args, **prompt_kwargs)
 
-    def start_move(self, event):
-        """Record initial mouse position for dragging."""
-        self._x = event.x
-        self._y = event.y
+    @classmethod
+    def ask(cls, *args, **kwargs):
+        """
+        Prompt with the class's shared dialog, building it on first use.
+        Takes the same arguments as the dialog's constructor.
 
-    def do_move(self, event):
-        """Calculate and apply window movement."""
-        dx = event.x - self._x
-        dy = event.y - self._y
-        x = self.winfo_x() + dx
-        y = self.winfo_y() + dy
-        self.geometry(f"+{x}+{y}")
+        Returns:
+            The dialog, with result (and choice) set from the user's answer
+        """
+        dialog = cls.__dict__.get("_shared")
+        if dialog is not None and dialog.winfo_exists():
+            dialog.prompt(*args, **kwargs)
+        else:
+            dialog = cls(*args, **kwargs)  # The constructor shows the first prompt
+            cls._shared = dialog
+        return dialog
 
-    def finish(self, value):
-        """Store result and close dialog."""
-        self.result = value
-        self.destroy()
-        self.quit()
-
-
-class IntBox(Toplevel):
-    """
-    Custom dialog for integer input using a spinbox.
-    Used for getting numeric values from user (e.g., recipient count).
-    """
-
-    def __init__(self, buttons, message):
+    def prompt(self, buttons, message):
         """
-        Initialize integer input dialog.
+        Show the dialog with a new message and wait for a button press.
 
         Args:
             buttons: List of button labels
             message: Prompt message for user
+
+        Returns:
+            The dialog's result
         """
-        super().__init__()
+        self.message_label.config(text=message)
+        self._set_buttons(buttons)
+        self.result = None
+        self.choice = ""
+        self._reset_input()
 
-        self.result = None  # Stores the integer value
-        self.choice = ""  # Stores which button was clicked
+        self.deiconify()
+        self.place_window_center()
+        self.wait_variable(self._answered)  # Set by finish()
+        return self.result
 
-        # Spinbox for number input (2-1000 range)
-        self.spinbox = ttk.Spinbox(
-            self,
-            from_=2,
-            to=1000,
-            width=10
-        )
-        self.spinbox.pack(side="bottom", pady=60)
+    def reprompt(self, message):
+        """
+        Ask again in the same window with the same buttons, e.g. after invalid input.
 
-        # Window configuration
-        self.geometry("580x400")
-        self.title("Mail Merge")
-        self.resizable(True, True)
-        self.attributes("-topmost", True)
-        self.overrideredirect(True)
+        Args:
+            message: Prompt message for user
 
-        # Display image
-        self.photo = PhotoImage(file="label.png")
-        image_label = Label(self, image=self.photo)
-        image_label.place(x=168, y=40)
+        Returns:
+            The dialog's result
+        """
+        return _BaseDialog.prompt(self, self._button_labels, message)
 
-        # Bottom button bar
-        bottom_frame = ttk.Frame(self)
-        bottom_frame.place(relx=0, rely=1, anchor="sw", relwidth=1)
+    def _build_input(self):
+        """Create the dialog's input widget (dialogs without one skip this)."""
+
+    def _place_message(self):
+        """Position the message label, centered near the top by default."""
+        self.message_label.place(relx=0.5, y=20, anchor='n')
+
+    def _set_buttons(self, buttons):
+        """
+        Fill the bottom bar with one button per label.
+        Keeps the existing buttons when the labels have not changed.
 
+        Args:
+            buttons: List of button labels
+        """
+        if tuple(buttons) == self._button_labels:
+            return
+        for widget in self.bottom_frame.winfo_children():
+            widget.destroy()
         for text in buttons:
-            btn1 = ttk.Button(bottom_frame, text=text, command=lambda v=text: self.finish(v))
+            btn1 = ttk.Button(self.bottom_frame, text=text, command=lambda v=text: self.finish(v))
             btn1.pack(side="left", expand=True, fill="x", padx=5, pady=5)
+        self._button_labels = tuple(buttons)
 
-        # Message label
-        text = ttk.Label(self, text=message, font=("Segoe UI", 10))
-        text.place(relx=0.5, y=20, anchor='n')
+    def _reset_input(self):
+        """Clear the input widget before a prompt (dialogs without one skip this)."""
 
-        self.place_window_center()
+    def _read_result(self, value):
+        """
+        Read the dialog's answer when a button is pressed.
 
-        # Enable dragging
-        self.bind("<Button-1>", self.start_move)
-        self.bind("<B1-Motion>", self.do_move)
+        Args:
+            value: Button text that was clicked
 
-        self.mainloop()
+        Returns:
+            The value stored in self.result
+        """
+        return value
 
     def start_move(self, event):
-        """Record initial position for dragging."""
+        """Record initial mouse position for dragging."""
         self._x = event.x
         self._y = event.y
 
     def do_move(self, event):
-        """Move window based on drag."""
+        """Calculate and apply window movement."""
         dx = event.x - self._x
         dy = event.y - self._y
         x = self.winfo_x() + dx
@@ -1290,158 +1764,112 @@ class IntBox(Toplevel):
         self.geometry(f"+{x}+{y}")
 
     def finish(self, value):
-        """Store spinbox value and button choice, then close."""
-        self.result = int(self.spinbox.get())
+        """Store result and button choice, then hide the dialog for reuse."""
+        self.result = self._read_result(value)
         self.choice = value
-        self.destroy()
-        self.quit()
+        self.withdraw()
+        self._answered.set(True)
 
 
-class StringBox(Toplevel):
+class CustomBox(_BaseDialog):
     """
-    Custom dialog for string input using an entry widget.
-    Used for getting text input from user (e.g., recipient names).
+    Custom message box with draggable interface.
+    Used for displaying messages with custom button options.
+    Constructed (or asked) with buttons, message and image_y.
     """
 
-    def __init__(self, buttons, message):
+    GEOMETRY = "480x350"
+    IMAGE_XY = None  # Placed per prompt at the requested height
+
+    def _place_message(self):
+        """Put the message at the top of the window."""
+        self.message_label.pack(side="top", pady=15)
+
+    def prompt(self, buttons, message, image_y):
         """
-        Initialize string input dialog.
+        Show the dialog with a new message and wait for a button press.
 
         Args:
             buttons: List of button labels
-            message: Prompt message for user
-        """
-        super().__init__()
-
-        self.result = None
-        self.choice = ""
-
-        # Entry widget for text input
-        self.entry = ttk.Entry(self)
-        self.entry.pack(side="bottom", pady=60)
+            message: Message text to display
+            image_y: Y-coordinate for image placement
 
-        # Window configuration
-        self.geometry("580x400")
-        self.title("Mail Merge")
-        self.resizable(True, True)
-        self.attributes("-topmost", True)
-        self.overrideredirect(True)
+        Returns:
+            The clicked button's text
+        """
+        self.image_label.place(x=128, y=image_y)
+        return super().prompt(buttons, message)
 
-        # Display image
-        self.photo = PhotoImage(file="label.png")
-        image_label = Label(self, image=self.photo)
-        image_label.place(x=168, y=40)
 
-        # Bottom button bar
-        bottom_frame = ttk.Frame(self)
-        bottom_frame.place(relx=0, rely=1, anchor="sw", relwidth=1)
+class IntBox(_BaseDialog):
+    """
+    Custom dialog for integer input using a spinbox.
+    Used for getting numeric values from user (e.g., recipient count).
+    """
 
-        for text in buttons:
-            btn1 = ttk.Button(bottom_frame, text=text, command=lambda v=text: self.finish(v))
-            btn1.pack(side="left", expand=True, fill="x", padx=5, pady=5)
+    def _build_input(self):
+        """Create the spinbox for number input (2-1000 range)."""
+        self.spinbox = ttk.Spinbox(
+            self,
+            from_=2,
+            to=1000,
+            width=10
+        )
+        self.spinbox.pack(side="bottom", pady=60)
 
-        # Message label
-        text = ttk.Label(self, text=message, font=("Segoe UI", 10))
-        text.place(relx=0.5, y=20, anchor='n')
+    def _reset_input(self):
+        """Empty the spinbox for a fresh answer."""
+        self.spinbox.delete(0, END)
 
-        self.place_window_center()
+    def _read_result(self, value):
+        """Return the spinbox value as an integer (None if it is not a number)."""
+        try:
+            return int(self.spinbox.get())
+        except ValueError:
+            return None
 
-        # Enable dragging
-        self.bind("<Button-1>", self.start_move)
-        self.bind("<B1-Motion>", self.do_move)
 
-        self.mainloop()
+class StringBox(_BaseDialog):
+    """
+    Custom dialog for string input using an entry widget.
+    Used for getting text input from user (e.g., recipient names).
+    """
 
-    def start_move(self, event):
-        """Record initial position for dragging."""
-        self._x = event.x
-        self._y = event.y
+    def _build_input(self):
+        """Create the entry widget for text input."""
+        self.entry = ttk.Entry(self)
+        self.entry.pack(side="bottom", pady=60)
 
-    def do_move(self, event):
-        """Move window based on drag."""
-        dx = event.x - self._x
-        dy = event.y - self._y
-        x = self.winfo_x() + dx
-        y = self.winfo_y() + dy
-        self.geometry(f"+{x}+{y}")
+    def _reset_input(self):
+        """Empty the entry for a fresh answer."""
+        self.entry.delete(0, END)
 
-    def finish(self, value):
-        """Store entry text and button choice, then close."""
-        self.result = self.entry.get()
-        self.choice = value
-        self.destroy()
-        self.quit()
+    def _read_result(self, value):
+        """Return the entry text."""
+        return self.entry.get()
 
 
-class TextBox(Toplevel):
+class TextBox(_BaseDialog):
     """
     Custom dialog for multi-line text input.
     Used for entering letter content in Mail Merge.
     """
 
-    def __init__(self, buttons, message):
-        """
-        Initialize text box dialog.
-
-        Args:
-            buttons: List of button labels
-            message: Prompt message for user
-        """
-        super().__init__()
+    GEOMETRY = "960x540"
+    IMAGE_XY = None  # No label image; the text box fills the window
 
-        self.result = None
-        self.choice = ""
-
-        # Multi-line text widget
+    def _build_input(self):
+        """Create the multi-line text widget."""
         self.text_box = ttk.Text(self, width=300, height=100)
         self.text_box.pack(padx=50, pady=50)
 
-        # Window configuration
-        self.geometry("960x540")
-        self.title("Mail Merge")
-        self.resizable(True, True)
-        self.attributes("-topmost", True)
-        self.overrideredirect(True)
-
-        # Bottom button bar
-        bottom_frame = ttk.Frame(self)
-        bottom_frame.place(relx=0, rely=1, anchor="sw", relwidth=1)
-
-        for text in buttons:
-            btn1 = ttk.Button(bottom_frame, text=text, command=lambda v=text: self.finish(v))
-            btn1.pack(side="left", expand=True, fill="x", padx=5, pady=5)
-
-        # Message label
-        text = ttk.Label(self, text=message, font=("Segoe UI", 10))
-        text.place(relx=0.5, y=20, anchor='n')
-
-        self.place_window_center()
-
-        # Enable dragging
-        self.bind("<Button-1>", self.start_move)
-        self.bind("<B1-Motion>", self.do_move)
+    def _reset_input(self):
+        """Empty the text box for a fresh answer."""
+        self.text_box.delete("1.0", END)
 
-        self.mainloop()
-
-    def start_move(self, event):
-        """Record initial position for dragging."""
-        self._x = event.x
-        self._y = event.y
-
-    def do_move(self, event):
-        """Move window based on drag."""
-        dx = event.x - self._x
-        dy = event.y - self._y
-        x = self.winfo_x() + dx
-        y = self.winfo_y() + dy
-        self.geometry(f"+{x}+{y}")
-
-    def finish(self, value):
-        """Store text content and button choice, then close."""
-        self.result = self.get_text()
-        self.choice = value
-        self.destroy()
-        self.quit()
+    def _read_result(self, value):
+        """Return the typed text."""
+        return self.get_text()
 
     def get_text(self):
         """
@@ -1464,12 +1892,60 @@ class Letter:
     Creates personalized letters by replacing [name] placeholder with recipient names.
     """
 
+    # Placeholders a letter may contain, written as [field]. All of them are
+    # matched in one regex pass; add a field here and supply its value in
+    # _write_letter to support it.
+    MERGE_FIELDS = ("name",)
+    PLACEHOLDER_RE = re.compile(r"\[(" + "|".join(map(re.escape, MERGE_FIELDS)) + r")\]")
+
     def __init__(self):
         """Initialize letter manager with empty state."""
         self.letter_body = ""  # Letter content template
         self.output_directory = ""  # Where to save generated letters
         self.letter_file_location = ""  # Source letter file path
+        self._last_letter_dir = None  # Folder the letter picker starts in (None = OS default)
+        self._last_output_dir = None  # Folder the output picker starts in
         self.is_placeholder_not_present = False  # Validation flag
+        self._segments = None  # Literal text between the placeholders of letter_body
+        self._fields = None  # Field name of each placeholder, in order
+        self._only_field = None  # Set when every placeholder is the same field
+        self._has_placeholder = False  # letter_body contains at least one [name]
+
+    def set_letter_body(self, letter_body):
+        """
+        Store the letter template and split it around its placeholders once.
+        The split serves both the placeholder check and every letter written.
+
+        Args:
+            letter_body: Letter text containing [name] placeholders
+        """
+        self.letter_body = letter_body
+        # Splitting on a capturing group alternates text and field names
+        parts = self.PLACEHOLDER_RE.split(letter_body)
+        self._segments = parts[0::2]
+        self._fields = parts[1::2]
+        self._has_placeholder = "name" in self._fields
+        # With a single field type the letter is just that value joining the segments
+        self._only_field = self._fields[0] if len(set(self._fields)) == 1 else None
+
+    def _personalize(self, values):
+        """
+        Fill in the template's placeholders.
+
+        Args:
+            values: Dict mapping each field name to its text
+
+        Returns:
+            str: The personalized letter
+        """
+        if self._only_field is not None:
+            return values[self._only_field].join(self._segments)
+
+        pieces = [self._segments[0]]
+        for field, text in zip(self._fields, self._segments[1:]):
+            pieces.append(values[field])
+            pieces.append(text)
+        return "".join(pieces)
 
     def show_placeholder_instructions(self):
         """Display reminder about using [name] placeholder in letters."""
@@ -1482,39 +1958,54 @@ class Letter:
         """
         Create individual letter files for each recipient.
         Replaces [name] placeholder with actual names and saves to disk.
-        Handles duplicate filenames by appending (1).
+        Handles duplicate filenames by appending (1), (2), ...
         """
         # Prompt for output directory
-        CustomBox(
+        CustomBox.ask(
             buttons=["Continue", "Exit"],
             message="Now please select the folders in which you want to save your mails.",
             image_y=40
         )
 
         self.output_directory = filedialog.askdirectory(
-            title="Where do you want to save the mails?"
+            title="Where do you want to save the mails?",
+            initialdir=self._last_output_dir
         )
+        if self.output_directory:
+            self._last_output_dir = self.output_directory
+
+        # Pick every output path up front, in order, so duplicate names get
+        # numbered suffixes exactly as if the files were written one by one
+        recipients = name_manager.recipient_names
+        output_paths = []
+
+        # List the folder once instead of probing it for every name. Names are
+        # compared case-folded, since Windows and macOS treat "Ann" and "ann"
+        # as the same file.
+        with os.scandir(self.output_directory or os.curdir) as entries:
+            taken = {entry.name.casefold() for entry in entries}
+
+        for recipient in recipients:
+            file_name = f"{recipient}'s Mail.txt"
+            if file_name.casefold() in taken:
+                # File exists, use the first free (n) suffix
+                file_name = next(
+                    candidate
+                    for candidate in (f"{recipient}'s Mail({n}).txt" for n in itertools.count(1))
+                    if candidate.casefold() not in taken
+                )
+            taken.add(file_name.casefold())  # Later duplicates see this one
+            output_paths.append(os.path.join(self.output_directory, file_name))
 
-        # Generate letter file for each recipient
-        for recipient in name_manager.recipient_names:
-            try:
-                # Check if file already exists
-                output_file = open(f"{self.output_directory}/{recipient}'s Mail.txt", "r")
-                output_file.close()
-
-                # File exists, create with (1) suffix
-                with open(f"{self.output_directory}/{recipient}'s Mail(1).txt", "w") as output_file:
-                    personalized_content = self.letter_body.replace("[name]", recipient)
-                    output_file.write(personalized_content)
-
-            except FileNotFoundError:
-                # File doesn't exist, create normally
-                with open(f"{self.output_directory}/{recipient}'s Mail.txt", "w") as output_file:
-                    personalized_content = self.letter_body.replace("[name]", recipient)
-                    output_file.write(personalized_content)
+        # The files are independent, so write them concurrently
+        # (threads overlap the disk waits; file writes release the GIL).
+        # Never start more threads than there are letters.
+        workers = max(1, min(32, (os.cpu_count() or 1) * 4, len(output_paths)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(self._write_letter, output_paths, recipients))
 
         # Show success message
-        CustomBox(["Exit"], "Your Mail Merge was successful, congratulations!", 40)
+        CustomBox.ask(["Exit"], "Your Mail Merge was successful, congratulations!", 40)
 
         # Open output folder in system file explorer
         if platform.system() == "Windows":
@@ -1524,101 +2015,104 @@ class Letter:
         else:  # Linux
             subprocess.call(["xdg-open", self.output_directory])
 
+    def _write_letter(self, output_path, recipient):
+        """
+        Write one personalized letter. Runs on a worker thread.
+
+        Args:
+            output_path: File to create (overwritten if present)
+            recipient: Name substituted for each [name] placeholder
+        """
+        with open(output_path, "w", encoding="utf-8") as output_file:
+            output_file.write(self._personalize({"name": recipient}))
+
     def process_letter_content(self):
         """
         Handle letter content input (file browse or manual typing).
         Validates [name] placeholder presence before proceeding.
         Manages the workflow: input → validation → generation.
+        Loops until a valid letter is given, rather than calling itself
+        again for every retry.
         """
-        # Ask user how they want to provide letter content
-        letter_choice_dialog = CustomBox(
-            ["Browse", "Type Letter Content"],
-            "How do you want to enter the letter content?\nAs a file or type it?",
-            50
-        )
-        file_input_choice = letter_choice_dialog.result
-
-        # Handle dialog cancellation
-        if file_input_choice is None:
-            show_exit_confirmation(self.process_letter_content)
-            return
-
-        # === BROWSE FILE OPTION ===
-        if file_input_choice == "Browse":
-            self.show_placeholder_instructions()
-
-            # Get letter file from user
-            self.letter_file_location = filedialog.askopenfilename(
-                title="Select your mail",
-                filetypes=(("Text files", "*.txt"),)
+        while True:
+            # Ask user how they want to provide letter content
+            letter_choice_dialog = CustomBox.ask(
+                ["Browse", "Type Letter Content"],
+                "How do you want to enter the letter content?\nAs a file or type it?",
+                50
             )
+            file_input_choice = letter_choice_dialog.result
+
+            # Handle dialog cancellation
+            if file_input_choice is None:
+                exit_confirmation()  # Only returns if the user stays
+                continue
+
+            # === BROWSE FILE OPTION ===
+            if file_input_choice == "Browse":
+                self.show_placeholder_instructions()
+
+                # Get letter file from user
+                self.letter_file_location = filedialog.askopenfilename(
+                    title="Select your mail",
+                    filetypes=(("Text files", "*.txt"),),
+                    initialdir=self._last_letter_dir
+                )
 
-            # Handle cancellation
-            if not self.letter_file_location:
-                show_exit_confirmation(self.process_letter_content)
-                return
+                # Handle cancellation
+                if not self.letter_file_location:
+                    exit_confirmation()
+                    continue
+                self._last_letter_dir = os.path.dirname(self.letter_file_location)
 
-            # Read letter content
-            with open(self.letter_file_location) as letter_file:
-                self.letter_body = letter_file.read()
+                # Read letter content
+                with open(self.letter_file_location) as letter_file:
+                    self.set_letter_body(letter_file.read())
 
                 # Validate [name] placeholder exists
-                name_place = self.letter_body.find("[name]")
-                if name_place < 0:
-                    CustomBox(["Try Again"], "Warning: Placeholder '[name]' not present in file.", 40)
-                    self.is_placeholder_not_present = True
-                else:
-                    self.is_placeholder_not_present = False
-
-                # Re-prompt if placeholder missing
+                self.is_placeholder_not_present = not self._has_placeholder
                 if self.is_placeholder_not_present:
-                    self.process_letter_content()
-                    return
+                    CustomBox.ask(["Try Again"], "Warning: Placeholder '[name]' not present in file.", 40)
+                    continue  # Re-prompt
 
-                # Proceed to generate letters
-                self.generate_personalized_letters()
+            # === TYPE CONTENT OPTION ===
+            elif file_input_choice == "Type Letter Content":
+                self.show_placeholder_instructions()
 
-        # === TYPE CONTENT OPTION ===
-        elif file_input_choice == "Type Letter Content":
-            self.show_placeholder_instructions()
+                # Get letter content via text box
+                letter_body_dialog = TextBox.ask(["Continue", "Exit"], "Enter the letter Content")
+                letter_body = letter_body_dialog.result
+                continue_choice = letter_body_dialog.choice
 
-            # Get letter content via text box
-            letter_body_dialog = TextBox(["Continue", "Exit"], "Enter the letter Content")
-            self.letter_body = letter_body_dialog.result
-            continue_choice = letter_body_dialog.choice
-
-            # Handle exit choice
-            if continue_choice == "Exit":
-                show_exit_confirmation(self.process_letter_content)
-                return
+                # Handle exit choice
+                if continue_choice == "Exit":
+                    exit_confirmation()
+                    continue
+
+                # Check for empty letter
+                elif continue_choice == "":
+                    Messagebox.show_warning(
+                        title="Mail Merge",
+                        message="The letter is empty, please try again."
+                    )
+                    continue
 
-            # Check for empty letter
-            elif continue_choice == "":
-                Messagebox.show_warning(
-                    title="Mail Merge",
-                    message="The letter is empty, please try again."
-                )
-                self.process_letter_content()
-                return
+                # Validate [name] placeholder
+                self.set_letter_body(letter_body)
+                self.is_placeholder_not_present = not self._has_placeholder
+                if self.is_placeholder_not_present:
+                    Messagebox.show_warning(
+                        title="Mail Merge",
+                        message="Warning: Placeholder '[name]' is not in the letter body"
+                    )
+                    continue  # Re-prompt
 
-            # Validate [name] placeholder
-            name_place = self.letter_body.find("[name]")
-            if name_place < 0:
-                Messagebox.show_warning(
-                    title="Mail Merge",
-                    message="Warning: Placeholder '[name]' is not in the letter body"
-                )
-                self.is_placeholder_not_present = True
             else:
-                self.is_placeholder_not_present = False
-
-            # Re-prompt if placeholder missing
-            if self.is_placeholder_not_present:
-                self.process_letter_content()
                 return
 
             # Proceed to generate letters
             self.generate_personalized_letters()
+            break
 
 
 # =============================================================================
@@ -1632,17 +2126,31 @@ class NameManager:
     Validates names contain only letters, spaces, and hyphens.
     """
 
+    # Name input method button labels
+    MANUAL_INSERT = "Manual Insert"
+    TEXT_FILE = "Text File"
+
+    NAMES_PREVIEW_CHARS = 500  # Longer name lists are cut short in the confirmation dialog
+    NAMES_READ_BUFFER = 1 << 16  # Bytes read from the names file per system call
+    NAMES_SNIFF_CHARS = 4096  # Start of the names file used to detect its separator
+    NAMES_DELIMITERS = ",;\t"  # Separators accepted between names (besides new lines)
+
     def __init__(self):
         """Initialize name manager with empty state."""
         self.recipient_names = []  # List of recipient names
-        self.name_input_method = ""  # "Manual Insert" or "Text File"
+        self._names_display = None  # Cached confirmation text (None = rebuild)
+        self.name_input_method = ""  # MANUAL_INSERT or TEXT_FILE
+        self.confirmation_choice = ""  # Choice made in the names confirmation dialog
         self.names_file_location = ""  # Path to names text file
+        self._last_names_dir = None  # Folder the names file picker starts in (None = OS default)
         self.total_recipients = 0  # Number of recipients for manual entry
 
         # Prompt messages
         self.name_input_method_prompt = "Do you want to enter names manually, or through a text file?"
         self.recipient_count_prompt = "How many people do you want send a mail to?"
         self.name_prompt = "Please enter the name:"
+        self.invalid_name_prompt = "Please enter a valid name:"
+        self.invalid_count_prompt = "Please enter a number of at least 2:"
 
     def name_collection(self):
         """
@@ -1651,77 +2159,83 @@ class NameManager:
         """
         while True:
             # Ask user how they want to provide names
-            name_input_method_dialog = CustomBox(
-                buttons=["Manual Insert", "Text File", "Exit"],
+            name_input_method_dialog = CustomBox.ask(
+                buttons=[self.MANUAL_INSERT, self.TEXT_FILE, "Exit"],
                 message=self.name_input_method_prompt,
                 image_y=40
             )
             self.name_input_method = name_input_method_dialog.result
 
-            # Handle cancellation
-            if self.name_input_method is None:
-                exit_confirmation()
-
             # Route to appropriate collection method
-            if self.name_input_method == "Manual Insert":
+            if self.name_input_method == self.MANUAL_INSERT:
                 self.ask_recipient_count()
                 self.collect_names_manually()
 
-            elif self.name_input_method == "Text File":
+            elif self.name_input_method == self.TEXT_FILE:
                 self.names_text_file_processing()
 
-            else:  # Exit option
+            else:  # Exit option or dialog closed
                 exit_confirmation()
+                continue
 
-            # Show collected names for confirmation
-            self.confirm_names_proceed()
-            break
+            # Show collected names for confirmation; start over if they are to be re-entered
+            if self.confirm_names_proceed() != "Re-enter Names":
+                break
 
     def ask_recipient_count(self):
         """
         Prompt user for number of recipients (minimum 2).
         Validates input is at least 2 recipients.
         """
+        # One dialog for the whole exchange; retries reuse it with a new message
+        total_recipients_dialog_box = IntBox.ask(["Continue", "Exit"], self.recipient_count_prompt)
+
         while True:
-            total_recipients_dialog_box = IntBox(["Continue", "Exit"], self.recipient_count_prompt)
             self.total_recipients = total_recipients_dialog_box.result
 
             # Handle exit choice
             if total_recipients_dialog_box.choice == "Exit":
                 self.total_recipients = 0
                 exit_confirmation()
+                total_recipients_dialog_box.reprompt(self.recipient_count_prompt)
+                continue
 
             # Validate minimum count
-            if self.total_recipients >= 2:
+            if self.total_recipients is not None and self.total_recipients >= 2:
                 break
+            total_recipients_dialog_box.reprompt(self.invalid_count_prompt)
 
     def collect_names_manually(self):
         """
         Collect names one-by-one through dialog boxes.
         Validates each name contains only: letters, spaces, hyphens.
-        Converts names to title case (First Letter Capitalized).
+        Converts names to title case (First Letter Capitalized) once all are entered.
         """
         # Collect remaining names (if some already exist)
         for _ in range(self.total_recipients - len(self.recipient_names)):
+            # Prompt for name; invalid entries are asked again in the same window
+            entered_name_dialog = StringBox.ask(["Continue", "Exit"], self.name_prompt)
+
             while True:
-                # Prompt for name
-                entered_name_dialog = StringBox(["Continue", "Exit"], self.name_prompt)
-                entered_name = entered_name_dialog.result
+                entered_name = entered_name_dialog.result.strip()
                 name_dialog_exit_choice = entered_name_dialog.choice
 
-                # Handle exit choice
+                # Handle exit choice; if the user stays, ask for the same name again
                 if name_dialog_exit_choice == "Exit":
-                    show_exit_confirmation(self.collect_names_manually)
-                    return
+                    exit_confirmation()
+                    entered_name_dialog.reprompt(self.name_prompt)
+                    continue
 
                 # Validate name (only letters, spaces, hyphens allowed)
-                if entered_name.replace(" ", "").replace("-", "").isalpha():
-                    self.name_prompt = "Please enter the name:"  # Reset prompt
-                    self.recipient_names.append(entered_name.title())  # Add in title case
+                if _names_match(_NAME_RE, entered_name):
+                    self.recipient_names.append(entered_name)
                     break
                 else:
-                    # Invalid name, update prompt
-                    self.name_prompt = "Please enter a valid name:"
+                    # Invalid name, ask again
+                    entered_name_dialog.reprompt(self.invalid_name_prompt)
+
+        # Title-case the whole list in one pass, the same way file names are
+        self.recipient_names = _title_names(self.recipient_names)
 
     def ask_name_file(self):
         """
@@ -1732,28 +2246,43 @@ class NameManager:
             self.names_file_location = ""
             self.names_file_location = filedialog.askopenfilename(
                 title="Select the names text file",
-                filetypes=(("Text files", "*.txt"),)
+                filetypes=(("Text files", "*.txt"),),
+                initialdir=self._last_names_dir
             )
 
             # Handle cancellation
             if not self.names_file_location:
                 exit_confirmation()
             else:
+                self._last_names_dir = os.path.dirname(self.names_file_location)
                 break
 
     def names_text_file_processing(self):
         """
         Read and parse names from text file.
-        Expected format: "Name1, Name2, Name3, ..."
-        Validates comma separation.
+        Expected format: "Name1, Name2, Name3, ..." (or separated by
+        semicolons, tabs or new lines).
+        Validates the name characters.
         """
         while True:
             self.ask_name_file()
 
             try:
-                # Read file content
-                with open(self.names_file_location) as names_file:
-                    names_content = names_file.read()
+                # Parse names in a single streaming pass (quoted names may contain commas)
+                with open(self.names_file_location, newline="", encoding="utf-8",
+                          buffering=self.NAMES_READ_BUFFER) as names_file:
+                    # Detect the separator from the start of the file
+                    try:
+                        delimiter = csv.Sniffer().sniff(
+                            names_file.read(self.NAMES_SNIFF_CHARS),
+                            delimiters=self.NAMES_DELIMITERS
+                        ).delimiter
+                    except csv.Error:
+                        delimiter = ","  # One name per line, or mixed separators
+                    names_file.seek(0)
+
+                    reader = csv.reader(names_file, delimiter=delimiter, skipinitialspace=True)
+                    names = [stripped for row in reader for name in row if (stripped := name.strip())]
 
             except Exception as e:
                 # Handle file read errors
@@ -1761,20 +2290,24 @@ class NameManager:
                     title="Error occurred",
                     message=f"Error: {e}"
                 )
-                self.name_collection()
-                return
+                continue  # Ask for another file
 
-            # Validate comma-separated format
-            if ", " not in names_content:
+            # Reject files that contain no names
+            if not names:
+                Messagebox.show_warning(
+                    title="Mail Merge",
+                    message="Please enter the names separated by commas, semicolons or new lines."
+                )
+            else:
+                names = _title_names(names)
+                if names is not None:
+                    break  # Valid format
                 Messagebox.show_warning(
                     title="Mail Merge",
-                    message="Please enter the names separated by comma."
+                    message="Names may only contain letters, spaces and hyphens."
                 )
-            elif ", " in names_content:
-                break  # Valid format
 
-        # Split names by comma and space
-        self.recipient_names = names_content.split(", ")
+        self.recipient_names = names
 
     def confirm_names_proceed(self):
         """
@@ -1784,35 +2317,96 @@ class NameManager:
         Returns:
             User's choice ("Continue", "Re-enter Names", or "Exit")
         """
-        global confirmation_choice
+        # Build the (shortened) name list once per collection, not per dialog
+        if self._names_display is None:
+            self._names_display = self._names_preview()
 
         # Show names for confirmation
-        names_confirmation_dialog = CustomBox(
-            message=f"Names entered:\n{', '.join(self.recipient_names)}",
+        names_confirmation_dialog = CustomBox.ask(
+            message=f"Names entered:\n{self._names_display}",
             buttons=["Continue", "Re-enter Names", "Exit"],
             image_y=60
         )
 
-        confirmation_choice = names_confirmation_dialog.result
+        self.confirmation_choice = names_confirmation_dialog.result
 
         # Handle user's choice
-        if confirmation_choice == "Continue":
-            return confirmation_choice
+        if self.confirmation_choice == "Continue":
+            return self.confirmation_choice
 
-        elif confirmation_choice == "Re-enter Names":
-            # Clear names and restart collection process
+        elif self.confirmation_choice == "Re-enter Names":
+            # Clear names; name_collection loops back to collect them again
             self.recipient_names = []
-            self.name_collection()
-            return
+            self._names_display = None
+            return self.confirmation_choice
         else:
             # Exit option selected
             exit_confirmation()
 
+    def _names_preview(self):
+        """
+        Build the name list shown for confirmation.
+        Only the names that fit in NAMES_PREVIEW_CHARS are joined, so a
+        huge recipient list never becomes one long string. The first name is
+        always shown, cut short if it alone is too long.
+
+        Returns:
+            Comma separated names, ending with the total count if some were left out
+        """
+        shown = []
+        length = 0
+        for name in self.recipient_names:
+            length += len(name) + 2  # Name plus ", "
+            if length > self.NAMES_PREVIEW_CHARS:
+                if not shown:
+                    shown.append(name[:self.NAMES_PREVIEW_CHARS] + "...")
+                break
+            shown.append(name)
+
+        preview = ", ".join(shown)
+        if len(shown) < len(self.recipient_names):
+            preview += f", ... ({len(self.recipient_names)} total)"
+        return preview
+
 
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
 
+def _names_match(pattern, text):
+    """
+    Check a name, or a NUL-joined list of names, against a name pattern.
+    Every character other than a space, hyphen or NUL must also pass
+    str.isalpha(), which rules out the numerals the pattern accepts.
+
+    Args:
+        pattern: _NAME_RE for one name, _NAME_LIST_RE for a joined list
+        text: Text to check
+
+    Returns:
+        True if the text is made of valid names
+    """
+    return pattern.fullmatch(text) is not None and text.translate(_NAME_SEPARATORS).isalpha()
+
+
+def _title_names(names):
+    """
+    Validate and title-case a list of names in bulk.
+    The names are joined once so validation is a single regex match and
+    title-casing a single str.title() call.
+
+    Args:
+        names: List of name strings
+
+    Returns:
+        List of title-cased names, or None if any name is invalid
+    """
+    joined = "\0".join(names)
+    if not _names_match(_NAME_LIST_RE, joined):
+        return None
+    return joined.title().split("\0")
+
+
 def center_window(window):
     """
     Center a window on the screen.
@@ -1828,30 +2422,322 @@ def center_window(window):
     window.geometry(f'{width}x{height}+{x}+{y}')
 
 
-def show_exit_confirmation(callback_function):
+# Decoded dialog images, shared by every dialog instance (see _cached_photo)
+_photo_cache = {}
+
+# Folder holding EduMerge.py and its image assets
+_ASSET_DIR = Path(__file__).resolve().parent
+
+
+def _cached_photo(filename):
     """
-    Show exit confirmation dialog.
-    If user chooses not to exit, calls the provided callback function.
+    Load an image file as a PhotoImage once and reuse it afterwards.
+    Dialogs open many times during a mail merge; decoding the PNG again
+    for each one is wasted work. Tk images outlive the windows showing
+    them as long as a reference is kept, which the cache provides.
 
     Args:
-        callback_function: Function to call if user chooses not to exit
+        filename: Name of the image file next to this script
+
+    Returns:
+        PhotoImage: The decoded image
     """
-    exit_dialog = CustomBox(["Yes", "No"], "Do you want to exit the app?", 40)
+    photo = _photo_cache.get(filename)
+    if photo is None:
+        # Resolved against the script folder, so launching from another
+        # working directory still finds the images
+        photo = _photo_cache[filename] = PhotoImage(file=str(_ASSET_DIR / filename))
+    return photo
 
-    user_choice = exit_dialog.result
 
-    if user_choice == "Yes":
-        exit()  # Terminate application
-    else:
-        callback_function()  # Return to previous screen
+def _read_csv_rows(filepath):
+    """
+    Read a CSV file into a header row and data rows.
+    Uses pandas' C parser when pandas is installed (much faster and lighter
+    on large files), otherwise the standard csv module. Files pandas would
+    change (short rows, blank lines) are read with the csv module too, so
+    saving an unchanged file writes it back as it was.
+
+    Args:
+        filepath: Path to the CSV file
+
+    Returns:
+        tuple: (headers: list of str, rows: list of lists of str)
+    """
+    if os.path.getsize(filepath) == 0:
+        return [], []  # Nothing to parse (and empty files cannot be memory-mapped)
+
+    try:
+        import pandas as pd
+    except ImportError:
+        pd = None
+
+    if pd is not None:
+        try:
+            df = pd.read_csv(
+                filepath,
+                header=None,  # Header row is read as data so names stay untouched
+                dtype=str,  # Keep cells exactly as written
+                na_filter=False,  # Empty cells stay "" instead of NaN
+                engine="c",
+                low_memory=False,
+                memory_map=True,  # Parse straight from the mapped file, like the csv path
+                encoding="utf-8"
+            )
+        except (pd.errors.EmptyDataError, pd.errors.ParserError):
+            pass  # Only blank lines, or ragged rows; the csv module keeps them as written
+        else:
+            rows = df.values.tolist()
+            if _csv_matches_rows(filepath, len(rows), df.shape[1]):
+                return rows[0], rows[1:]
+
+    # Map the file and decode it in one pass instead of streaming it through
+    # the text layer's read buffer; utf-8-sig drops a leading BOM if present
+    with open(filepath, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            text = str(mapped, 'utf-8-sig')
+    rows = list(csv.reader(io.StringIO(text, newline='')))
+    return (rows[0], rows[1:]) if rows else ([], [])
+
+
+def _csv_matches_rows(filepath, row_count, width):
+    """
+    Check that pandas read every line of a CSV file as a full row.
+    pandas pads short rows and skips blank lines, which only the file itself
+    can reveal: without quotes, each line must be one row with width - 1 commas.
+
+    Args:
+        filepath: Path to the (non-empty) CSV file
+        row_count: Number of rows pandas returned
+        width: Number of columns pandas returned
+
+    Returns:
+        bool: True if the rows are exactly what the file holds
+    """
+    line_breaks = commas = 0
+    block = b""
+    with open(filepath, 'rb') as file:
+        while chunk := file.read(1 << 20):  # Count a MiB at a time, in C
+            if b'"' in chunk:
+                return False  # Quoted cells may hide commas and line breaks
+            line_breaks += chunk.count(b"\n")
+            commas += chunk.count(b",")
+            block = chunk
+    lines = line_breaks + (not block.endswith(b"\n"))  # Last line may lack a line break
+    return lines == row_count and commas == row_count * (width - 1)
+
+
+@contextmanager
+def _atomic_write(filepath, mode, **open_args):
+    """
+    Open a temporary file next to filepath for writing, then move it over
+    filepath once everything is written and flushed to disk. A failed or
+    interrupted save leaves the previous file untouched.
+
+    Args:
+        filepath: Destination path
+        mode: File mode ("w" or "wb")
+        **open_args: Extra arguments passed to open()
+
+    Yields:
+        The open temporary file
+    """
+    tmp_path = filepath + ".tmp"
+    try:
+        with open(tmp_path, mode, **open_args) as file:
+            yield file
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, filepath)  # Atomic swap on the same volume
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _write_csv_rows(filepath, rows):
+    """
+    Write rows to a CSV file.
+    Uses pandas' C writer when pandas is installed and every row has the
+    same width; otherwise (or for ragged rows, which pandas would pad with
+    empty cells) the standard csv module.
+
+    Args:
+        filepath: Destination path for the CSV file
+        rows: List of rows, each a list of cell strings
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        pd = None
+
+    with _atomic_write(filepath, 'w', newline='', encoding='utf-8') as file:
+        if pd is not None and rows and len({len(row) for row in rows}) == 1:
+            # Same quoting and line endings as csv.writer's defaults
+            pd.DataFrame(rows).to_csv(file, header=False, index=False, lineterminator="\r\n")
+        else:
+            csv.writer(file).writerows(rows)
+
+
+def _read_docx_paragraphs(filepath):
+    """
+    Extract the plain text of every top-level paragraph in a Word document.
+    Like python-docx's doc.paragraphs, paragraphs inside tables and text
+    boxes are left out. Streams word/document.xml straight out of the archive with lxml's
+    iterparse instead of building python-docx's object model, and frees
+    each paragraph once read, so memory stays flat on large documents.
+
+    Args:
+        filepath: Path to the DOCX file
+
+    Returns:
+        List of paragraph strings, in document order
+    """
+    from lxml import etree  # Installed alongside python-docx
+
+    body_tag, paragraph_tag = _W_NS + "body", _W_NS + "p"
+    text_tag, tab_tag, break_tag = _W_NS + "t", _W_NS + "tab", _W_NS + "br"
+
+    paragraphs = []
+    with zipfile.ZipFile(filepath) as archive, archive.open("word/document.xml") as xml_file:
+        for _, elem in etree.iterparse(xml_file, events=("end",), tag=paragraph_tag):
+            if elem.getparent().tag != body_tag:
+                elem.clear()  # Table cell or text box; its text is not a paragraph of the body
+                continue
+
+            parts = []
+            for node in elem.iter(text_tag, tab_tag, break_tag):
+                if node.tag == text_tag:
+                    parts.append(node.text or "")
+                elif node.tag == tab_tag:
+                    parts.append("\t")
+                else:
+                    parts.append("\n")
+            paragraphs.append("".join(parts))
+
+            # Drop the parsed paragraph and everything before it
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+    return paragraphs
+
+
+def _pdf_renderers():
+    """
+    Import the PDF page renderers on first use, so starting the app or
+    running a mail merge never pays for loading them.
+
+    Returns:
+        tuple: (pypdfium2 module, pdf2image module), None for any not installed
+    """
+    global _pdf_renderer_modules
+    if _pdf_renderer_modules is None:
+        try:
+            import pypdfium2 as pdfium
+        except ImportError:
+            pdfium = None
+        try:
+            import pdf2image
+        except ImportError:
+            pdf2image = None
+        _pdf_renderer_modules = (pdfium, pdf2image)
+    return _pdf_renderer_modules
+
+
+def _read_pdf_layout(filepath):
+    """
+    Read the page count and page size of a PDF (runs on a worker thread).
+
+    Args:
+        filepath: Path to the PDF file
+
+    Returns:
+        tuple: (page count, page width, page height) with sizes in PDF points
+    """
+    pdfium, pdf2image = _pdf_renderers()
+    if pdfium is not None:
+        pdf = pdfium.PdfDocument(filepath)
+        try:
+            width, height = pdf[0].get_size()
+            return len(pdf), width, height
+        finally:
+            pdf.close()
+
+    if pdf2image is None:
+        raise ImportError("No PDF renderer installed")
+    info = pdf2image.pdfinfo_from_path(filepath)
+    size = info.get("Page size", "612 x 792 pts").split()  # e.g. "612 x 792 pts (letter)"
+    return int(info["Pages"]), float(size[0]), float(size[2])
+
+
+def _extract_pdf_text(filepath, emit, stop):
+    """
+    Extract a PDF's text page by page with pypdf, handing each page over
+    as soon as it is read. Runs on the PDF worker thread.
+
+    Args:
+        filepath: Path to the PDF file
+        emit: Called with the text of each page, then with None when done
+        stop: threading.Event; extraction ends early once it is set
+    """
+    try:
+        from pypdf import PdfReader
+
+        reader = PdfReader(filepath)
+        for page_num, page in enumerate(reader.pages, 1):
+            if stop.is_set():
+                break
+            emit(f"--- Page {page_num} ---\n\n{page.extract_text() or ''}\n\n")
+    finally:
+        emit(None)  # Always tell the Tk side to stop polling
+
+
+def _render_pdf_page(filepath, page_num, dpi):
+    """
+    Rasterize a single PDF page (runs on a worker thread).
+    PDFium renders in-process, avoiding poppler's per-call process start and
+    image round-trip through temp files. pypdfium2 is not thread-safe, which
+    is fine here because the PDF executor has a single worker.
+
+    Args:
+        filepath: Path to the PDF file
+        page_num: 1-based page number
+        dpi: Render resolution
+
+    Returns:
+        PIL image of the page
+    """
+    pdfium, pdf2image = _pdf_renderers()
+    if pdfium is not None:
+        pdf = pdfium.PdfDocument(filepath)
+        try:
+            return pdf[page_num - 1].render(scale=dpi / 72).to_pil()
+        finally:
+            pdf.close()
+
+    if pdf2image is None:
+        raise ImportError("No PDF renderer installed")
+    return pdf2image.convert_from_path(
+        filepath,
+        dpi=dpi,
+        first_page=page_num,
+        last_page=page_num,
+        fmt="jpeg",  # Much smaller than PPM to write and read back
+        jpegopt={"quality": 85, "progressive": False, "optimize": False}
+    )[0]
 
 
 def exit_confirmation():
     """
     Show exit confirmation dialog without callback.
     Simply exits if user confirms, otherwise returns to previous state.
+    Uses the shared CustomBox window, so repeated cancels never stack
+    extra dialogs.
     """
-    exit_dialog = CustomBox(["Yes", "No"], "Do you want to exit the app?", 40)
+    exit_dialog = CustomBox.ask(["Yes", "No"], "Do you want to exit the app?", 40)
 
     user_choice = exit_dialog.result
 
@@ -1869,13 +2755,13 @@ def exit_confirmation():
 # Create hidden window (will be shown by text editor if selected)
 app_window = ttk.Window(themename="darkly")
 app_window.attributes('-alpha', 0)  # Start invisible
-app_window.iconbitmap("logo.ico")
+# Set application icon once; the text editor runs in this same window
+try:
+    app_window.iconbitmap(str(_ASSET_DIR / "logo.ico"))
+except TclError:
+    pass  # Icon missing or unsupported (.ico only works on Windows)
 center_window(app_window)
 
-# === INITIALIZE VARIABLES ===
-confirmation_choice = ""  # Stores user's name confirmation choice
-input_method_choice = ""  # Stores name input method choice
-
 # === CREATE MANAGER OBJECTS ===
 name_manager = NameManager()  # Handles recipient name collection
 letter = Letter()  # Handles letter generation
@@ -1887,16 +2773,16 @@ while True:
     software_choice = start_screen.result
 
     # Handle user's software choice
-    if software_choice == "📧Mail Merge":
+    if software_choice == StartingWindow.MAIL_MERGE:
         break  # Proceed to Mail Merge
-    elif software_choice == "📝Text Editor":
+    elif software_choice == StartingWindow.TEXT_EDITOR:
         break  # Proceed to Text Editor
-    elif software_choice == "❌Exit":
+    elif software_choice == StartingWindow.EXIT:
         exit_confirmation()  # Confirm before exiting
 
 # === LAUNCH SELECTED SOFTWARE ===
 
-if software_choice == "📧Mail Merge":
+if software_choice == StartingWindow.MAIL_MERGE:
     # === MAIL MERGE WORKFLOW ===
     # Step 1: Collect recipient names
     name_manager.name_collection()
@@ -1904,7 +2790,7 @@ if software_choice == "📧Mail Merge":
     # Step 2: Process letter content and generate personalized letters
     letter.process_letter_content()
 
-elif software_choice == "📝Text Editor":
+elif software_choice == StartingWindow.TEXT_EDITOR:
     # === TEXT EDITOR WORKFLOW ===
     # Launch text editor application
     textEditor_launch()
\ No newline at end of file
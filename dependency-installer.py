@@ -3,6 +3,8 @@ EduText Automatic Dependency Installer
 Automatically installs and configures all required dependencies
 """
 
+import importlib.util
+import io
 import sys
 import subprocess
 import os
@@ -25,14 +27,49 @@ class Color:
     END = '\033[0m'
 
 
+def decode_output(data):
+    """
+    Decode captured subprocess output for display
+
+    Args:
+        data: Raw bytes from a PIPE (or None)
+
+    Returns:
+        str: Decoded text with undecodable bytes replaced
+    """
+    return (data or b"").decode("utf-8", "replace").strip()
+
+
 class DependencyInstaller:
     """Handles automatic installation of all dependencies"""
 
-    def __init__(self):
+    COPY_BUFFER_SIZE = 1 << 20  # Buffer size for streamed downloads and extraction (1 MiB)
+
+    # Linux package manager -> (distribution, [(command, description), ...])
+    LINUX_POPPLER_COMMANDS = {
+        'apt-get': ("Debian/Ubuntu", [
+            (['sudo', 'apt-get', 'update'], "Updating package list"),
+            (['sudo', 'apt-get', 'install', '-y', 'poppler-utils'], "Installing poppler-utils"),
+        ]),
+        'dnf': ("Fedora", [
+            (['sudo', 'dnf', 'install', '-y', 'poppler-utils'], "Installing poppler-utils"),
+        ]),
+        'pacman': ("Arch", [
+            (['sudo', 'pacman', '-S', '--noconfirm', 'poppler'], "Installing poppler"),
+        ]),
+        'yum': ("CentOS/RHEL", [
+            (['sudo', 'yum', 'install', '-y', 'poppler-utils'], "Installing poppler-utils"),
+        ]),
+    }
+
+    def __init__(self, deep_verify=False):
         self.system = platform.system()
-        self.errors = []
-        self.warnings = []
-        self.installed = []
+        self.deep_verify = deep_verify  # Really import packages when verifying (slower)
+        # Summary lines are written as they happen, ready to print at the end
+        self._errors_buf = io.StringIO()
+        self._warnings_buf = io.StringIO()
+        self._installed_buf = io.StringIO()
+        self._seen_installed = set()  # Repeated successes are only listed once
 
     def print_header(self, text):
         """Print formatted section header"""
@@ -47,17 +84,19 @@ class DependencyInstaller:
     def print_success(self, text):
         """Print success message"""
         print(f"{Color.GREEN}✓ {text}{Color.END}")
-        self.installed.append(text)
+        if text not in self._seen_installed:
+            self._seen_installed.add(text)
+            self._installed_buf.write(f"  {Color.GREEN}✓{Color.END} {text}\n")
 
     def print_error(self, text):
         """Print error message"""
         print(f"{Color.RED}✗ {text}{Color.END}")
-        self.errors.append(text)
+        self._errors_buf.write(f"  {Color.RED}✗{Color.END} {text}\n")
 
     def print_warning(self, text):
         """Print warning message"""
         print(f"{Color.YELLOW}⚠ {text}{Color.END}")
-        self.warnings.append(text)
+        self._warnings_buf.write(f"  {Color.YELLOW}⚠{Color.END} {text}\n")
 
     def run_command(self, cmd, description, check=True):
         """
@@ -69,28 +108,30 @@ class DependencyInstaller:
             check: Whether to check return code
 
         Returns:
-            tuple: (success: bool, output: str)
+            tuple: (success: bool, output: str) - output is the error text, empty on success
         """
         try:
             if isinstance(cmd, str):
                 cmd = cmd.split()
 
+            # Only stderr is ever shown, so stdout is discarded rather than piped
             result = subprocess.run(
                 cmd,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 check=check
             )
 
             if result.returncode == 0:
                 self.print_success(description)
-                return True, result.stdout
+                return True, ""
             else:
-                self.print_error(f"{description} - {result.stderr}")
-                return False, result.stderr
+                error_output = decode_output(result.stderr)
+                self.print_error(f"{description} - {error_output}")
+                return False, error_output
 
         except subprocess.CalledProcessError as e:
-            self.print_error(f"{description} - {e.stderr}")
+            self.print_error(f"{description} - {decode_output(e.stderr)}")
             return False, str(e)
         except FileNotFoundError:
             self.print_error(f"{description} - Command not found")
@@ -104,13 +145,8 @@ class DependencyInstaller:
         self.print_step("Checking pip installation")
 
         try:
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "--version"],
-                capture_output=True,
-                text=True
-            )
-
-            if result.returncode == 0:
+            # Locate pip's package without starting another interpreter (or importing pip)
+            if importlib.util.find_spec("pip") is not None:
                 self.print_success("pip is available")
                 return True
             else:
@@ -137,15 +173,15 @@ class DependencyInstaller:
         try:
             result = subprocess.run(
                 [sys.executable, "-m", "pip", "install", package, "--upgrade"],
-                capture_output=True,
-                text=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
             )
 
             if result.returncode == 0:
                 self.print_success(f"{display_name} installed successfully")
                 return True
             else:
-                self.print_error(f"Failed to install {display_name}: {result.stderr}")
+                self.print_error(f"Failed to install {display_name}: {decode_output(result.stderr)}")
                 return False
 
         except Exception as e:
@@ -161,13 +197,31 @@ class DependencyInstaller:
             ('ttkbootstrap', 'ttkbootstrap (Modern UI)'),
             ('python-docx', 'python-docx (Word Documents)'),
             ('pypdf', 'pypdf (PDF Reading)'),
-            ('pdf2image', 'pdf2image (PDF Image Rendering)'),
+            ('pypdfium2', 'pypdfium2 (PDF Image Rendering)'),
+            ('pdf2image', 'pdf2image (PDF Rendering Fallback)'),
         ]
 
-        success_count = 0
-        for package, display in packages:
-            if self.install_pip_package(package, display):
-                success_count += 1
+        # One pip run resolves everything together and reuses its index connection
+        self.print_step("Installing all packages")
+
+        try:
+            result = subprocess.run(
+                [sys.executable, "-m", "pip", "install", "--upgrade", *(package for package, _ in packages)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+            batch_ok = result.returncode == 0
+        except Exception:
+            batch_ok = False
+
+        if batch_ok:
+            for _, display in packages:
+                self.print_success(f"{display} installed successfully")
+            success_count = len(packages)
+        else:
+            # Fall back to one package at a time to find out which ones failed
+            self.print_warning("Batch install failed - retrying packages individually")
+            success_count = sum(self.install_pip_package(package, display) for package, display in packages)
 
         print(f"\n{Color.BOLD}Python packages: {success_count}/{len(packages)} installed{Color.END}")
         return success_count == len(packages)
@@ -178,7 +232,13 @@ class DependencyInstaller:
 
         # Check if already installed
         try:
-            result = subprocess.run(['pdftoppm', '-v'], capture_output=True, timeout=5)
+            # pdftoppm prints its version to stderr
+            result = subprocess.run(
+                ['pdftoppm', '-v'],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                timeout=5
+            )
             if result.returncode == 0 or result.stderr:
                 self.print_success("Poppler already installed")
                 return True
@@ -198,7 +258,9 @@ class DependencyInstaller:
         try:
             # Download Poppler
             print("  Downloading... (this may take a few minutes)")
-            urllib.request.urlretrieve(poppler_url, zip_path)
+            with urllib.request.urlopen(poppler_url) as response, \
+                    open(zip_path, 'wb', buffering=self.COPY_BUFFER_SIZE) as zip_file:
+                shutil.copyfileobj(response, zip_file, length=self.COPY_BUFFER_SIZE)
             self.print_success("Poppler downloaded")
 
             # Extract Poppler
@@ -215,21 +277,22 @@ class DependencyInstaller:
                     print(f"  Using alternative path: {extract_path}")
 
             with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_path)
+                # Find the bin directory from the archive listing instead of walking the extracted tree
+                bin_entry = next(
+                    (name for name in zip_ref.namelist() if name.endswith("/pdftoppm.exe")),
+                    None
+                )
+                self.extract_zip(zip_ref, extract_path)
 
             self.print_success(f"Poppler extracted to {extract_path}")
 
             # Add to PATH
             self.print_step("Adding Poppler to system PATH")
 
-            poppler_bin = os.path.join(extract_path, "poppler-24.08.0", "Library", "bin")
-
-            if not os.path.exists(poppler_bin):
-                # Try to find the bin directory
-                for root, dirs, files in os.walk(extract_path):
-                    if 'pdftoppm.exe' in files:
-                        poppler_bin = root
-                        break
+            if bin_entry:
+                poppler_bin = os.path.normpath(os.path.join(extract_path, os.path.dirname(bin_entry)))
+            else:
+                poppler_bin = os.path.join(extract_path, "poppler-24.08.0", "Library", "bin")
 
             if not os.path.exists(poppler_bin):
                 self.print_error(f"Could not find Poppler bin directory in {extract_path}")
@@ -253,14 +316,18 @@ class DependencyInstaller:
                 except FileNotFoundError:
                     current_path = ''
 
-                # Check if already in PATH
-                if poppler_bin.lower() not in current_path.lower():
+                # Check if already in PATH (whole entries only, so a longer path sharing the prefix doesn't count)
+                path_entries = frozenset(p.strip().casefold() for p in current_path.split(';') if p)
+                if poppler_bin.casefold() not in path_entries:
                     new_path = current_path + ';' + poppler_bin if current_path else poppler_bin
                     winreg.SetValueEx(key, 'Path', 0, winreg.REG_EXPAND_SZ, new_path)
                     winreg.CloseKey(key)
 
                     self.print_success("Poppler added to PATH")
-                    self.print_warning("Please restart your terminal/IDE for PATH changes to take effect")
+                    if self.broadcast_environment_change():
+                        self.print_success("Newly started programs will see the updated PATH")
+                    else:
+                        self.print_warning("Please restart your terminal/IDE for PATH changes to take effect")
                 else:
                     self.print_success("Poppler already in PATH")
 
@@ -287,6 +354,56 @@ class DependencyInstaller:
             except:
                 pass
 
+    def extract_zip(self, zip_ref, extract_path):
+        """
+        Extract every member of a zip archive using large copy buffers
+
+        Args:
+            zip_ref: Open zipfile.ZipFile
+            extract_path: Destination directory
+
+        Raises:
+            ValueError: If a member would be written outside extract_path
+        """
+        root = os.path.realpath(extract_path)
+
+        for member in zip_ref.infolist():
+            target = os.path.realpath(os.path.join(root, member.filename))
+
+            # Refuse entries like "../x" that would escape the destination
+            if os.path.commonpath([root, target]) != root:
+                raise ValueError(f"Unsafe path in archive: {member.filename}")
+
+            if member.is_dir():
+                os.makedirs(target, exist_ok=True)
+                continue
+
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with zip_ref.open(member) as src, open(target, 'wb', buffering=self.COPY_BUFFER_SIZE) as dst:
+                shutil.copyfileobj(src, dst, length=self.COPY_BUFFER_SIZE)
+
+    def broadcast_environment_change(self):
+        """
+        Tell running Windows programs (e.g. Explorer) that the user environment changed
+
+        Returns:
+            bool: True if the broadcast was delivered
+        """
+        try:
+            import ctypes
+
+            HWND_BROADCAST = 0xFFFF
+            WM_SETTINGCHANGE = 0x001A
+            SMTO_ABORTIFHUNG = 0x0002
+
+            result = ctypes.c_ulong()
+            return bool(ctypes.windll.user32.SendMessageTimeoutW(
+                HWND_BROADCAST, WM_SETTINGCHANGE, 0, "Environment",
+                SMTO_ABORTIFHUNG, 5000, ctypes.byref(result)
+            ))
+        except Exception:
+            return False
+
     def install_poppler_macos(self):
         """Install Poppler on macOS"""
         self.print_header("INSTALLING POPPLER FOR MACOS")
@@ -295,7 +412,7 @@ class DependencyInstaller:
         self.print_step("Checking for Homebrew")
 
         try:
-            result = subprocess.run(['brew', '--version'], capture_output=True, text=True)
+            result = subprocess.run(['brew', '--version'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             if result.returncode == 0:
                 self.print_success("Homebrew is installed")
             else:
@@ -319,46 +436,17 @@ class DependencyInstaller:
         """Install Poppler on Linux"""
         self.print_header("INSTALLING POPPLER FOR LINUX")
 
-        # Detect package manager
-        if shutil.which('apt-get'):
-            # Debian/Ubuntu
-            print("Detected Debian/Ubuntu system")
-            return self.run_command(
-                ['sudo', 'apt-get', 'update'],
-                "Updating package list"
-            )[0] and self.run_command(
-                ['sudo', 'apt-get', 'install', '-y', 'poppler-utils'],
-                "Installing poppler-utils"
-            )[0]
-
-        elif shutil.which('dnf'):
-            # Fedora
-            print("Detected Fedora system")
-            return self.run_command(
-                ['sudo', 'dnf', 'install', '-y', 'poppler-utils'],
-                "Installing poppler-utils"
-            )[0]
-
-        elif shutil.which('pacman'):
-            # Arch
-            print("Detected Arch system")
-            return self.run_command(
-                ['sudo', 'pacman', '-S', '--noconfirm', 'poppler'],
-                "Installing poppler"
-            )[0]
-
-        elif shutil.which('yum'):
-            # CentOS/RHEL
-            print("Detected CentOS/RHEL system")
-            return self.run_command(
-                ['sudo', 'yum', 'install', '-y', 'poppler-utils'],
-                "Installing poppler-utils"
-            )[0]
+        # Detect package manager (first match wins)
+        manager = next((name for name in self.LINUX_POPPLER_COMMANDS if shutil.which(name)), None)
 
-        else:
-            self.print_error("Could not detect package manager")
-            print(f"\n{Color.YELLOW}Please install poppler-utils manually for your distribution{Color.END}")
-            return False
+        if manager:
+            distribution, steps = self.LINUX_POPPLER_COMMANDS[manager]
+            print(f"Detected {distribution} system")
+            return all(self.run_command(cmd, description)[0] for cmd, description in steps)
+
+        self.print_error("Could not detect package manager")
+        print(f"\n{Color.YELLOW}Please install poppler-utils manually for your distribution{Color.END}")
+        return False
 
     def install_poppler(self):
         """Install Poppler based on OS"""
@@ -372,6 +460,28 @@ class DependencyInstaller:
             self.print_warning(f"Unsupported OS: {self.system}")
             return False
 
+    def probe_imports(self, modules):
+        """
+        Import modules in a separate Python process
+
+        Args:
+            modules: List of module names to import
+
+        Returns:
+            bool: True if every module imported successfully
+        """
+        probe = "; ".join(f"import {module}" for module in modules)
+
+        try:
+            result = subprocess.run(
+                [sys.executable, "-c", probe],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+            return result.returncode == 0
+        except Exception:
+            return False
+
     def verify_installation(self):
         """Verify all installations"""
         self.print_header("VERIFYING INSTALLATION")
@@ -386,15 +496,26 @@ class DependencyInstaller:
             ('ttkbootstrap', 'ttkbootstrap'),
             ('docx', 'python-docx'),
             ('pypdf', 'pypdf'),
+            ('pypdfium2', 'pypdfium2'),
             ('pdf2image', 'pdf2image'),
         ]
 
-        for module, display in packages_to_test:
-            try:
-                __import__(module)
+        modules = [module for module, _ in packages_to_test]
+
+        if self.deep_verify:
+            # Import everything in one throwaway interpreter; only probe modules
+            # one by one when that fails, to find the culprit
+            all_ok = self.probe_imports(modules)
+            results = [all_ok or self.probe_imports([module]) for module in modules]
+        else:
+            # Only locate the packages; none of their import-time code runs
+            results = [importlib.util.find_spec(module) is not None for module in modules]
+
+        for (module, display), importable in zip(packages_to_test, results):
+            if importable:
                 self.print_success(f"{display} import successful")
                 verification_tests.append(True)
-            except ImportError:
+            else:
                 self.print_error(f"{display} import failed")
                 verification_tests.append(False)
 
@@ -402,7 +523,13 @@ class DependencyInstaller:
         self.print_step("Testing Poppler")
 
         try:
-            result = subprocess.run(['pdftoppm', '-v'], capture_output=True, timeout=5)
+            # pdftoppm prints its version to stderr
+            result = subprocess.run(
+                ['pdftoppm', '-v'],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                timeout=5
+            )
             if result.returncode == 0 or result.stderr:
                 self.print_success("Poppler is accessible")
                 verification_tests.append(True)
@@ -430,8 +557,12 @@ class DependencyInstaller:
 
         resources = ['logo.ico', 'logo.png', 'label.png']
 
+        # One directory listing instead of a stat() per resource
+        with os.scandir('.') as entries:
+            present = {entry.name for entry in entries}
+
         for resource in resources:
-            if not os.path.exists(resource):
+            if resource not in present:
                 self.print_warning(f"{resource} not found - app will work without it")
             else:
                 self.print_success(f"{resource} found")
@@ -440,26 +571,25 @@ class DependencyInstaller:
         """Print installation summary"""
         self.print_header("INSTALLATION SUMMARY")
 
+        has_errors = self._errors_buf.tell() > 0
+
         print(f"\n{Color.BOLD}Successfully Installed:{Color.END}")
-        if self.installed:
-            for item in self.installed:
-                print(f"  {Color.GREEN}✓{Color.END} {item}")
+        if self._installed_buf.tell():
+            sys.stdout.write(self._installed_buf.getvalue())
         else:
             print("  None")
 
-        if self.warnings:
+        if self._warnings_buf.tell():
             print(f"\n{Color.BOLD}Warnings:{Color.END}")
-            for warning in self.warnings:
-                print(f"  {Color.YELLOW}⚠{Color.END} {warning}")
+            sys.stdout.write(self._warnings_buf.getvalue())
 
-        if self.errors:
+        if has_errors:
             print(f"\n{Color.BOLD}Errors:{Color.END}")
-            for error in self.errors:
-                print(f"  {Color.RED}✗{Color.END} {error}")
+            sys.stdout.write(self._errors_buf.getvalue())
 
         print("\n" + "=" * 70)
 
-        if not self.errors:
+        if not has_errors:
             print(f"{Color.GREEN}{Color.BOLD}✓ INSTALLATION COMPLETE!{Color.END}")
             print(f"{Color.GREEN}Your EduText application is ready to use.{Color.END}")
         else:
@@ -477,7 +607,7 @@ class DependencyInstaller:
         print(f"\nThis installer will:")
         print("  1. Check pip availability")
         print("  2. Install required Python packages")
-        print("  3. Install Poppler (for PDF rendering)")
+        print("  3. Install Poppler (optional, for the pdf2image PDF fallback)")
         print("  4. Verify all installations")
 
         response = input(f"\n{Color.BOLD}Continue? (y/n): {Color.END}").lower()
@@ -495,7 +625,7 @@ class DependencyInstaller:
 
         # Install Poppler
         print(f"\n{Color.BOLD}Install Poppler for PDF image rendering?{Color.END}")
-        print("(Required for best PDF viewing experience)")
+        print("(Only needed if pypdfium2 is unavailable on your system)")
         response = input("Install Poppler? (y/n): ").lower()
 
         if response == 'y':
@@ -517,12 +647,12 @@ class DependencyInstaller:
 def main():
     """Main entry point"""
 
+    installer = DependencyInstaller(deep_verify="--deep-verify" in sys.argv[1:])
+
     # Check if running with appropriate privileges
-    if platform.system() == "Linux" and os.geteuid() == 0:
+    if installer.system == "Linux" and os.geteuid() == 0:
         print(f"{Color.YELLOW}Warning: Running as root. Consider running as regular user.{Color.END}")
 
-    installer = DependencyInstaller()
-
     try:
         installer.run()
     except KeyboardInterrupt:
@@ -7,8 +7,19 @@ import sys
 import subprocess
 import os
 import platform
-from importlib import import_module
-from pathlib import Path
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib import import_module, metadata, util
+
+# Operating system name, looked up once
+SYSTEM = platform.system()
+
+# Modules whose pip distribution name differs from the import name
+DISTRIBUTION_NAMES = {
+    'PIL': 'Pillow',
+    'docx': 'python-docx',
+}
 
 class Color:
     """ANSI color codes for terminal output"""
@@ -19,80 +30,143 @@ class Color:
     BOLD = '\033[1m'
     END = '\033[0m'
 
+# Colored pieces of the check lines, built once
+_OK = f"{Color.GREEN}✓{Color.END} "
+_FAIL = f"{Color.RED}✗{Color.END} "
+_WARN = f"{Color.YELLOW}⚠{Color.END} "
+_INSTALLED = f": {Color.GREEN}INSTALLED{Color.END}"
+_NOT_FOUND = f": {Color.RED}NOT FOUND{Color.END}"
+_WARNING = f": {Color.YELLOW}WARNING{Color.END} - "
+
+def _banner(text, rule, style):
+    """
+    Build a three-line banner (rule, text, rule) as one string
+
+    Args:
+        text: Banner text
+        rule: Full-width rule line
+        style: ANSI codes applied to every line
+
+    Returns:
+        str: The banner, without leading or trailing blank lines
+    """
+    return "\n".join(f"{style}{line}{Color.END}" for line in (rule, text, rule))
+
 def print_header(text):
     """Print formatted section header"""
-    print(f"\n{Color.BOLD}{Color.BLUE}{'=' * 70}{Color.END}")
-    print(f"{Color.BOLD}{Color.BLUE}{text.center(70)}{Color.END}")
-    print(f"{Color.BOLD}{Color.BLUE}{'=' * 70}{Color.END}\n")
+    sys.stdout.write("\n" + _banner(text.center(70), '=' * 70, Color.BOLD + Color.BLUE) + "\n\n")
 
 def print_subheader(text):
     """Print formatted subsection header"""
-    print(f"\n{Color.BOLD}{'-' * 70}{Color.END}")
-    print(f"{Color.BOLD}{text}{Color.END}")
-    print(f"{Color.BOLD}{'-' * 70}{Color.END}")
+    sys.stdout.write("\n" + _banner(text, '-' * 70, Color.BOLD) + "\n")
 
 def check_success(name, version=""):
     """Print success message"""
     version_text = f" (version {version})" if version else ""
-    print(f"{Color.GREEN}✓{Color.END} {name}: {Color.GREEN}INSTALLED{Color.END}{version_text}")
+    sys.stdout.write(_OK + name + _INSTALLED + version_text + "\n")
 
 def check_failure(name, message=""):
     """Print failure message"""
     msg_text = f" - {message}" if message else ""
-    print(f"{Color.RED}✗{Color.END} {name}: {Color.RED}NOT FOUND{Color.END}{msg_text}")
+    sys.stdout.write(_FAIL + name + _NOT_FOUND + msg_text + "\n")
 
 def check_warning(name, message):
     """Print warning message"""
-    print(f"{Color.YELLOW}⚠{Color.END} {name}: {Color.YELLOW}WARNING{Color.END} - {message}")
+    sys.stdout.write(_WARN + name + _WARNING + message + "\n")
+
+@lru_cache(maxsize=None)
+def probe_python_library(module_name):
+    """
+    Find a module and look up its version without printing anything.
+    Installed distributions are checked without importing them; only
+    modules without package metadata (e.g. the standard library) are imported.
+    Results are cached, so checking a module again repeats no work.
+
+    Args:
+        module_name: Name of the module to check
+
+    Returns:
+        tuple: (success: bool, version: str or None, error: str or None)
+    """
+    if util.find_spec(module_name) is None:
+        return False, None, f"No module named '{module_name}'"
+
+    version = distribution_version(DISTRIBUTION_NAMES.get(module_name, module_name))
+    if version is not None:
+        return True, version, None
+
+    try:
+        module = import_module(module_name)
+    except ImportError as e:
+        return False, None, str(e)
+
+    # Try to get version (skipping e.g. a "version" submodule)
+    for attr in ['__version__', 'VERSION', 'version']:
+        version = getattr(module, attr, None)
+        if isinstance(version, tuple):
+            return True, '.'.join(map(str, version)), None
+        if isinstance(version, str):
+            return True, version, None
+
+    return True, None, None
 
-def check_python_library(module_name, display_name=None):
+@lru_cache(maxsize=None)
+def distribution_version(dist_name):
+    """
+    Read an installed distribution's version from its metadata (no import)
+
+    Args:
+        dist_name: pip distribution name, e.g. "Pillow"
+
+    Returns:
+        str or None: Version, or None if no such distribution is installed
+    """
+    try:
+        return metadata.version(dist_name)
+    except metadata.PackageNotFoundError:
+        return None
+
+def check_python_library(module_name, display_name=None, probe=None):
     """
     Check if a Python library is installed
 
     Args:
         module_name: Name of the module to import
         display_name: Optional display name (defaults to module_name)
+        probe: Result of probe_python_library if already computed
 
     Returns:
         tuple: (success: bool, version: str or None)
     """
     display_name = display_name or module_name
+    success, version, error = probe or probe_python_library(module_name)
 
-    try:
-        module = import_module(module_name)
-
-        # Try to get version
-        version = None
-        for attr in ['__version__', 'VERSION', 'version']:
-            if hasattr(module, attr):
-                version = getattr(module, attr)
-                if isinstance(version, tuple):
-                    version = '.'.join(map(str, version))
-                break
-
+    if success:
         check_success(display_name, version)
-        return True, version
-
-    except ImportError as e:
-        check_failure(display_name, str(e))
-        return False, None
+    else:
+        check_failure(display_name, error)
+    return success, version
 
-def check_system_command(cmd, name=None):
+@lru_cache(maxsize=None)
+def probe_system_command(cmd):
     """
-    Check if a system command is available
+    Run a command's version flag without printing anything
+    (cached, so each command is spawned at most once per run)
 
     Args:
         cmd: Command to check
-        name: Display name (defaults to cmd)
 
     Returns:
-        bool: True if command is available
+        tuple: (status: "found", "missing", "timeout" or "error", detail: str)
     """
-    name = name or cmd
+    # A PATH lookup is enough to rule out missing tools without spawning anything
+    if shutil.which(cmd) is None:
+        return "missing", "Command not found in PATH"
 
     try:
         result = subprocess.run(
             [cmd, '--version'],
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
             timeout=5
@@ -100,10 +174,11 @@ def check_system_command(cmd, name=None):
 
         output = (result.stdout + result.stderr).strip()
 
-        # Try -v flag if --version doesn't work
-        if result.returncode != 0:
+        # Try -v flag only if --version failed without printing anything
+        if result.returncode != 0 and not output:
             result = subprocess.run(
                 [cmd, '-v'],
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
                 timeout=5
@@ -112,92 +187,127 @@ def check_system_command(cmd, name=None):
 
         if result.returncode == 0 or output:
             # Extract version if available
-            version_line = output.split('\n')[0][:80]
-            check_success(name, version_line if version_line else "")
-            return True
+            return "found", output.split('\n')[0][:80]
         else:
-            check_failure(name)
-            return False
+            return "missing", ""
 
     except FileNotFoundError:
-        check_failure(name, "Command not found in PATH")
-        return False
+        return "missing", "Command not found in PATH"
     except subprocess.TimeoutExpired:
-        check_warning(name, "Command found but timed out")
-        return True
+        return "timeout", "Command found but timed out"
     except Exception as e:
-        check_failure(name, str(e))
+        return "error", str(e)
+
+def check_system_command(cmd, name=None, probe=None):
+    """
+    Check if a system command is available
+
+    Args:
+        cmd: Command to check
+        name: Display name (defaults to cmd)
+        probe: Result of probe_system_command if already computed
+
+    Returns:
+        bool: True if command is available
+    """
+    name = name or cmd
+    status, detail = probe or probe_system_command(cmd)
+
+    if status == "found":
+        check_success(name, detail)
+        return True
+    elif status == "timeout":
+        check_warning(name, detail)
+        return True
+    else:
+        check_failure(name, detail)
         return False
 
-def check_file_exists(filepath, description):
+def check_file_exists(filepath, description, present=None):
     """
     Check if a file exists
 
     Args:
         filepath: Path to check
         description: Description of the file
+        present: Optional set of names in the current directory to check
+            against instead of querying the filesystem
 
     Returns:
         bool: True if file exists
     """
-    if Path(filepath).exists():
+    found = filepath in present if present is not None else os.path.exists(filepath)
+
+    if found:
         check_success(description, f"Found at {filepath}")
         return True
     else:
         check_failure(description, f"Not found at {filepath}")
         return False
 
-def main():
-    """Run complete diagnostic"""
+def main(verbose=False):
+    """
+    Run complete diagnostic
+
+    Args:
+        verbose: Probe every Poppler tool instead of stopping at the first one found
+    """
 
     print_header("EDUTEXT DEPENDENCY DIAGNOSTIC TOOL")
 
     # System information
     print_subheader("System Information")
-    print(f"Operating System: {platform.system()} {platform.release()}")
+    print(f"Operating System: {SYSTEM} {platform.release()}")
     print(f"Platform: {platform.platform()}")
     print(f"Architecture: {platform.machine()}")
     print(f"Python Version: {sys.version}")
     print(f"Python Executable: {sys.executable}")
 
-    # Required Python libraries
-    print_subheader("Core Python Libraries (Required)")
-
     core_libs = {
         'tkinter': 'tkinter (Built-in GUI)',
         'PIL': 'Pillow (Image processing)',
         'ttkbootstrap': 'ttkbootstrap (Modern UI)',
     }
 
+    doc_libs = {
+        'csv': 'csv (Built-in)',
+        'docx': 'python-docx (Word documents)',
+        'pypdf': 'pypdf (PDF reading)',
+    }
+
+    optional_libs = {
+        'pypdfium2': 'pypdfium2 (PDF image rendering)',
+        'pdf2image': 'pdf2image (PDF rendering fallback, needs Poppler)',
+        'pandas': 'pandas (Faster CSV loading)',
+    }
+
+    # Check all libraries at once in worker threads; results are printed in order below
+    all_modules = [*core_libs, *doc_libs, *optional_libs]
+    with ThreadPoolExecutor() as executor:
+        probes = dict(zip(all_modules, executor.map(probe_python_library, all_modules)))
+
+    # Required Python libraries
+    print_subheader("Core Python Libraries (Required)")
+
     core_results = {}
     for module, display in core_libs.items():
-        success, version = check_python_library(module, display)
+        success, version = check_python_library(module, display, probes[module])
         core_results[module] = success
 
     # Document processing libraries
     print_subheader("Document Processing Libraries (Required)")
 
-    doc_libs = {
-        'csv': 'csv (Built-in)',
-        'docx': 'python-docx (Word documents)',
-        'pypdf': 'pypdf (PDF reading)',
-    }
-
     doc_results = {}
     for module, display in doc_libs.items():
-        success, version = check_python_library(module, display)
+        success, version = check_python_library(module, display, probes[module])
         doc_results[module] = success
 
     # Optional libraries
     print_subheader("Optional Libraries (Enhanced Features)")
 
-    optional_libs = {
-        'pdf2image': 'pdf2image (PDF image rendering)',
-    }
-
     optional_results = {}
     for module, display in optional_libs.items():
-        success, version = check_python_library(module, display)
+        success, version = check_python_library(module, display, probes[module])
         optional_results[module] = success
 
     # System tools (for PDF image rendering)
@@ -206,9 +316,20 @@ def main():
     poppler_cmds = ['pdftoppm', 'pdfinfo', 'pdftocairo']
     poppler_found = False
 
-    for cmd in poppler_cmds:
-        if check_system_command(cmd, f"Poppler - {cmd}"):
-            poppler_found = True
+    if verbose:
+        # Each probe waits on a subprocess (up to its timeout), so run them side by side
+        with ThreadPoolExecutor(max_workers=len(poppler_cmds)) as executor:
+            command_probes = dict(zip(poppler_cmds, executor.map(probe_system_command, poppler_cmds)))
+
+        for cmd in poppler_cmds:
+            if check_system_command(cmd, f"Poppler - {cmd}", command_probes[cmd]):
+                poppler_found = True
+    else:
+        # One working tool means Poppler is installed, so only run the first one on PATH
+        on_path = [cmd for cmd in poppler_cmds if shutil.which(cmd)]
+        poppler_found = any(check_system_command(cmd, f"Poppler - {cmd}") for cmd in on_path)
+        if not on_path:
+            check_failure("Poppler", f"{', '.join(poppler_cmds)} not found in PATH")
 
     # Check for resource files
     print_subheader("Resource Files")
@@ -219,18 +340,29 @@ def main():
         'label.png': 'Label Image',
     }
 
+    # All resources live in the current directory, so one listing answers every check
+    try:
+        with os.scandir('.') as entries:
+            present = {entry.name for entry in entries}
+    except OSError:
+        present = None  # Fall back to checking each file
+
     resource_results = {}
     for filename, description in resource_files.items():
-        resource_results[filename] = check_file_exists(filename, description)
+        resource_results[filename] = check_file_exists(filename, description, present)
 
     # PATH information
     print_subheader("System PATH")
 
-    path_dirs = os.environ.get('PATH', '').split(os.pathsep)
-    print(f"\nTotal directories in PATH: {len(path_dirs)}")
+    path_str = os.environ.get('PATH', '')
+    # Counting separators gives the entry count without building a list
+    print(f"\nTotal directories in PATH: {path_str.count(os.pathsep) + 1}")
 
-    # Highlight important paths
-    poppler_paths = [p for p in path_dirs if 'poppler' in p.lower()]
+    # Highlight important paths (only split PATH if poppler appears at all)
+    if 'poppler' in path_str.lower():
+        poppler_paths = [p for p in path_str.split(os.pathsep) if 'poppler' in p.lower()]
+    else:
+        poppler_paths = []
     if poppler_paths:
         print(f"\n{Color.GREEN}Poppler-related paths found:{Color.END}")
         for p in poppler_paths:
@@ -268,7 +400,7 @@ def main():
         print(f"{Color.GREEN}Your EduText application should work!{Color.END}")
 
         if not poppler_found or passed_optional < total_optional:
-            print(f"\n{Color.YELLOW}Note: PDF image rendering requires pdf2image and Poppler.{Color.END}")
+            print(f"\n{Color.YELLOW}Note: PDF image rendering requires pypdfium2 (or pdf2image and Poppler).{Color.END}")
             print(f"{Color.YELLOW}Text extraction fallback will be used for PDFs.{Color.END}")
     else:
         print(f"{Color.RED}{Color.BOLD}✗ MISSING REQUIRED DEPENDENCIES{Color.END}")
@@ -289,7 +421,7 @@ def main():
                     missing_packages.append('Pillow')
                 elif module == 'tkinter':
                     print(f"{Color.YELLOW}tkinter is built-in but may need system package:{Color.END}")
-                    if platform.system() == "Linux":
+                    if SYSTEM == "Linux":
                         print("  Ubuntu/Debian: sudo apt-get install python3-tk")
                         print("  Fedora: sudo dnf install python3-tkinter")
                 else:
@@ -315,14 +447,14 @@ def main():
         if not poppler_found:
             print(f"\n{Color.BOLD}Install Poppler (for PDF image rendering):{Color.END}\n")
 
-            if platform.system() == "Windows":
+            if SYSTEM == "Windows":
                 print("Windows:")
                 print("  1. Download from: https://github.com/oschwartz10612/poppler-windows/releases/")
                 print("  2. Extract to C:\\poppler")
                 print("  3. Add C:\\poppler\\Library\\bin to PATH")
                 print("  4. Restart terminal/IDE")
 
-            elif platform.system() == "Darwin":
+            elif SYSTEM == "Darwin":
                 print("macOS:")
                 print("  brew install poppler")
 
@@ -345,10 +477,12 @@ def main():
 
 if __name__ == "__main__":
     try:
-        main()
+        main(verbose="--verbose" in sys.argv[1:])
     except KeyboardInterrupt:
         print(f"\n\n{Color.YELLOW}Diagnostic interrupted by user.{Color.END}")
     except Exception as e:
         print(f"\n\n{Color.RED}Error during diagnostic: {e}{Color.END}")
     finally:
-        input("\nPress Enter to exit...")
\ No newline at end of file
+        # Only pause for a person at a terminal, never for scripts or installers
+        if "--no-pause" not in sys.argv[1:] and sys.stdin.isatty() and sys.stdout.isatty():
+            input("\nPress Enter to exit...")
\ No newline at end of file
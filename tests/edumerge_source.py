@@ -0,0 +1,24 @@
+"""
+Load EduMerge.py's definitions for tests.
+
+EduMerge.py opens the app window and starts the main flow when it is run,
+so the tests execute only its definitions (everything above the
+INITIALIZATION & MAIN FLOW section) into a fresh namespace.
+"""
+
+from pathlib import Path
+
+SOURCE = Path(__file__).resolve().parent.parent / "EduMerge.py"
+
+
+def load_definitions():
+    """
+    Execute EduMerge.py up to its main flow.
+
+    Returns:
+        dict: The module namespace (classes, helpers and constants)
+    """
+    source = SOURCE.read_text(encoding="utf-8")
+    namespace = {"__file__": str(SOURCE), "__name__": "EduMerge"}
+    exec(source[:source.index("# INITIALIZATION & MAIN FLOW")], namespace)
+    return namespace
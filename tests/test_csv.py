@@ -0,0 +1,82 @@
+"""
+Tests for reading and writing CSV files in EduMerge.py, with and
+without pandas installed.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from importlib import util
+from unittest import mock
+
+from edumerge_source import load_definitions
+
+HAS_PANDAS = util.find_spec("pandas") is not None
+
+
+@unittest.skipUnless(util.find_spec("ttkbootstrap") and util.find_spec("PIL"), "needs ttkbootstrap and Pillow")
+class CsvRowsTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        ns = load_definitions()
+        cls.read_rows = staticmethod(ns["_read_csv_rows"])
+        cls.write_rows = staticmethod(ns["_write_csv_rows"])
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+        self.path = os.path.join(self.folder.name, "data.csv")
+
+    def write_bytes(self, data):
+        with open(self.path, "wb") as file:
+            file.write(data)
+
+    def read_bytes(self):
+        with open(self.path, "rb") as file:
+            return file.read()
+
+    def check_round_trip(self, data):
+        """Reading a file and saving the rows unchanged must rewrite the same bytes."""
+        def test():
+            self.write_bytes(data)
+            headers, rows = self.read_rows(self.path)
+            self.write_rows(self.path, [headers] + rows)
+            self.assertEqual(self.read_bytes(), data)
+        self.check_both_readers(test)
+
+    def check_both_readers(self, test):
+        """Run test once with pandas (if installed) and once with the csv module."""
+        if HAS_PANDAS:
+            with self.subTest(reader="pandas"):
+                test()
+        with self.subTest(reader="csv"), mock.patch.dict(sys.modules, {"pandas": None}):
+            test()
+
+    def test_empty_file(self):
+        self.write_bytes(b"")
+        self.check_both_readers(lambda: self.assertEqual(self.read_rows(self.path), ([], [])))
+
+    def test_ragged_rows_round_trip(self):
+        self.write_bytes(b"a,b,c\r\n1,2,3\r\n4,5\r\n6\r\n")
+        self.check_both_readers(
+            lambda: self.assertEqual(self.read_rows(self.path), (["a", "b", "c"], [["1", "2", "3"], ["4", "5"], ["6"]]))
+        )
+        self.check_round_trip(b"a,b,c\r\n1,2,3\r\n4,5\r\n6\r\n")
+
+    def test_blank_lines_round_trip(self):
+        self.check_round_trip(b"a,b\r\n1,2\r\n\r\n3,4\r\n")
+
+    def test_only_blank_lines_round_trip(self):
+        self.check_round_trip(b"\r\n\r\n")
+
+    def test_regular_rows_round_trip(self):
+        self.check_round_trip(b"name,score\r\nAnn Lee,10\r\nBob,\r\n")
+
+    def test_quoted_cells_round_trip(self):
+        self.check_round_trip(b'name,note\r\n"Lee, Ann","two\r\nlines"\r\n')
+
+
+if __name__ == "__main__":
+    unittest.main()
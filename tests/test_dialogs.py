@@ -0,0 +1,149 @@
+"""
+Tests for the reusable mail merge dialogs in EduMerge.py.
+
+EduMerge.py starts the app when it is run, so the module definitions are
+loaded from its source and the dialog classes are rebuilt on lightweight
+stand-ins for the Tk widgets (no display is needed).
+"""
+
+import ast
+import unittest
+from importlib import util
+from types import SimpleNamespace
+
+from edumerge_source import SOURCE, load_definitions
+
+DIALOG_CLASSES = ("_BaseDialog", "CustomBox", "IntBox", "StringBox", "TextBox")
+
+
+class FakeWidget:
+    """Stand-in for a ttk widget: accepts any layout call and keeps its text."""
+
+    def __init__(self, master=None, **options):
+        self.options = options
+        self.value = ""
+        self.children = []
+        if isinstance(master, FakeWidget):
+            master.children.append(self)
+
+    def pack(self, **options):
+        pass
+
+    def place(self, **options):
+        pass
+
+    def config(self, **options):
+        self.options.update(options)
+
+    def destroy(self):
+        pass
+
+    def winfo_children(self):
+        return list(self.children)
+
+    def delete(self, *indices):
+        self.value = ""
+
+    def get(self, *indices):
+        return self.value
+
+
+class FakeToplevel(FakeWidget):
+    """Stand-in for ttkbootstrap's Toplevel; pressing a button is simulated by wait_variable."""
+
+    answer = None  # Button the "user" presses; None presses the first one
+    typed = ""  # Text the "user" enters before pressing it
+
+    def __init__(self):
+        super().__init__()
+        self.prompts = 0
+
+    def geometry(self, *args):
+        pass
+
+    title = resizable = attributes = overrideredirect = bind = geometry
+    deiconify = withdraw = place_window_center = geometry
+
+    def winfo_exists(self):
+        return True
+
+    def wait_variable(self, variable):
+        self.prompts += 1
+        for widget in ("spinbox", "entry", "text_box"):
+            if hasattr(self, widget):
+                getattr(self, widget).value = self.typed
+        self.finish(self.answer or self._button_labels[0])
+
+
+class FakeVar:
+    def __init__(self, master=None):
+        self.value = None
+
+    def set(self, value):
+        self.value = value
+
+
+def load_dialogs():
+    """Return a namespace holding the dialog classes built on the fakes."""
+    namespace = load_definitions()
+    namespace.update(
+        Toplevel=FakeToplevel,
+        Label=FakeWidget,
+        _cached_photo=lambda filename: None,
+        ttk=SimpleNamespace(BooleanVar=FakeVar, Frame=FakeWidget, Label=FakeWidget, Button=FakeWidget,
+                            Spinbox=FakeWidget, Entry=FakeWidget, Text=FakeWidget),
+    )
+    source = SOURCE.read_text(encoding="utf-8")
+    tree = ast.parse(source)
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name in DIALOG_CLASSES:
+            exec(ast.get_source_segment(source, node), namespace)
+    return namespace
+
+
+@unittest.skipUnless(util.find_spec("ttkbootstrap") and util.find_spec("PIL"), "needs ttkbootstrap and Pillow")
+class DialogAskTests(unittest.TestCase):
+
+    def setUp(self):
+        self.ns = load_dialogs()
+        FakeToplevel.answer = None
+        FakeToplevel.typed = ""
+
+    def test_custom_box_first_ask_accepts_keywords(self):
+        dialog = self.ns["CustomBox"].ask(buttons=["Continue", "Exit"], message="Names entered:", image_y=60)
+        self.assertEqual(dialog.result, "Continue")
+        self.assertEqual(dialog.message_label.options["text"], "Names entered:")
+
+    def test_int_box_first_ask_accepts_keywords(self):
+        FakeToplevel.typed = "5"
+        dialog = self.ns["IntBox"].ask(buttons=["Continue", "Exit"], message="How many?")
+        self.assertEqual(dialog.result, 5)
+
+    def test_string_box_first_ask_accepts_keywords(self):
+        FakeToplevel.typed = "Ann Lee"
+        dialog = self.ns["StringBox"].ask(buttons=["Continue", "Exit"], message="Name:")
+        self.assertEqual(dialog.result, "Ann Lee")
+
+    def test_text_box_first_ask_accepts_keywords(self):
+        FakeToplevel.typed = "Dear [name],"
+        dialog = self.ns["TextBox"].ask(buttons=["Continue", "Exit"], message="Letter")
+        self.assertEqual(dialog.result, "Dear [name],")
+
+    def test_ask_reuses_window_with_keywords(self):
+        custom_box = self.ns["CustomBox"]
+        first = custom_box.ask(["Yes", "No"], "Exit?", 40)
+        FakeToplevel.answer = "Text File"
+        second = custom_box.ask(buttons=["Manual Insert", "Text File", "Exit"], message="How?", image_y=40)
+        self.assertIs(first, second)
+        self.assertEqual(second.result, "Text File")
+        self.assertEqual(second.prompts, 2)
+
+    def test_each_class_keeps_its_own_window(self):
+        custom = self.ns["CustomBox"].ask(buttons=["OK"], message="Hi", image_y=40)
+        string = self.ns["StringBox"].ask(buttons=["OK"], message="Hi")
+        self.assertIsNot(custom, string)
+        self.assertIsInstance(string, self.ns["StringBox"])
+
+
+if __name__ == "__main__":
+    unittest.main()
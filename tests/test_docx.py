@@ -0,0 +1,54 @@
+"""
+Tests for reading paragraphs out of Word documents in EduMerge.py.
+"""
+
+import os
+import tempfile
+import unittest
+import zipfile
+from importlib import util
+
+from edumerge_source import load_definitions
+
+W = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+
+def paragraph(text):
+    return f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>"
+
+
+@unittest.skipUnless(util.find_spec("ttkbootstrap") and util.find_spec("PIL") and util.find_spec("lxml"),
+                     "needs ttkbootstrap, Pillow and lxml")
+class DocxParagraphsTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.read_paragraphs = staticmethod(load_definitions()["_read_docx_paragraphs"])
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+        self.path = os.path.join(self.folder.name, "letter.docx")
+
+    def write_body(self, body):
+        with zipfile.ZipFile(self.path, "w") as archive:
+            archive.writestr("word/document.xml", f"<w:document {W}><w:body>{body}</w:body></w:document>")
+
+    def test_runs_tabs_and_breaks(self):
+        self.write_body("<w:p><w:r><w:t>Dear</w:t><w:tab/><w:t>Ann</w:t><w:br/><w:t>Hi</w:t></w:r></w:p>"
+                        + paragraph(""))
+        self.assertEqual(self.read_paragraphs(self.path), ["Dear\tAnn\nHi", ""])
+
+    def test_table_paragraphs_left_out(self):
+        table = f"<w:tbl><w:tr><w:tc>{paragraph('Cell one')}</w:tc><w:tc>{paragraph('Cell two')}</w:tc></w:tr></w:tbl>"
+        self.write_body(paragraph("Before") + table + paragraph("After"))
+        self.assertEqual(self.read_paragraphs(self.path), ["Before", "After"])
+
+    def test_text_box_paragraphs_left_out(self):
+        text_box = f"<w:r><w:pict><w:txbxContent>{paragraph('Boxed')}</w:txbxContent></w:pict></w:r>"
+        self.write_body(f"<w:p><w:r><w:t>Outer</w:t></w:r>{text_box}</w:p>" + paragraph("Next"))
+        self.assertEqual(self.read_paragraphs(self.path), ["Outer", "Next"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Tests for validating and title-casing recipient names in EduMerge.py.
+"""
+
+import unittest
+from importlib import util
+from types import SimpleNamespace
+
+from edumerge_source import load_definitions
+
+
+@unittest.skipUnless(util.find_spec("ttkbootstrap") and util.find_spec("PIL"), "needs ttkbootstrap and Pillow")
+class TitleNamesTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        ns = load_definitions()
+        cls.title_names = staticmethod(ns["_title_names"])
+        cls.names_match = staticmethod(ns["_names_match"])
+        cls.name_re = ns["_NAME_RE"]
+
+    def test_names_are_title_cased(self):
+        self.assertEqual(self.title_names(["ann lee", "JOSÉ-MARÍA", "zoë"]), ["Ann Lee", "José-María", "Zoë"])
+
+    def test_invalid_name_rejects_the_list(self):
+        for name in ["Ann2", "Ann_", "Ann½", "Ⅻ", "-", "", "Ann.", "Ann\0"]:
+            with self.subTest(name=name):
+                self.assertIsNone(self.title_names(["Bob", name]))
+
+    def test_same_names_as_isalpha(self):
+        for name in ["Ann", "Ann Lee", "-Ann", "Ann½", "Ann²", "Ann2", " ", "O'Neil", "李雷"]:
+            with self.subTest(name=name):
+                expected = name.replace(" ", "").replace("-", "").isalpha()
+                self.assertEqual(self.names_match(self.name_re, name), expected)
+
+
+@unittest.skipUnless(util.find_spec("ttkbootstrap") and util.find_spec("PIL"), "needs ttkbootstrap and Pillow")
+class NamesPreviewTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.name_manager = load_definitions()["NameManager"]
+
+    def preview(self, names, limit=20):
+        manager = SimpleNamespace(recipient_names=names, NAMES_PREVIEW_CHARS=limit)
+        return self.name_manager._names_preview(manager)
+
+    def test_short_list_shown_in_full(self):
+        self.assertEqual(self.preview(["Ann", "Bob"]), "Ann, Bob")
+
+    def test_long_list_cut_short_with_total(self):
+        self.assertEqual(self.preview(["Ann", "Bob", "Cy", "Dee", "Eve", "Fay"]), "Ann, Bob, Cy, Dee, ... (6 total)")
+
+    def test_long_first_name_still_shown(self):
+        self.assertEqual(self.preview(["A" * 30, "Bob"]), "A" * 20 + "..., ... (2 total)")
+        self.assertEqual(self.preview(["A" * 30]), "A" * 20 + "...")
+
+    def test_no_names(self):
+        self.assertEqual(self.preview([]), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,231 @@
+"""
+Tests for the editor's edit tracker in EduMerge.py: the Tcl wrapper around
+the text widget's command and the line, character and word bookkeeping it
+drives.
+
+There is no display here, so the wrapper is installed in a plain Tcl
+interpreter around a small Tcl stand-in for the text widget. The stand-in
+keeps Tk's rules for indices and for deletes that reach the final newline.
+"""
+
+import ast
+import random
+import re
+import tkinter
+import unittest
+from importlib import util
+from types import MethodType, SimpleNamespace
+
+from edumerge_source import SOURCE, load_definitions
+
+# Text widget stand-in: the text lives in ::text, and Tk's final newline is implied.
+# Supports the indices the wrapper and the app use ("L.C", "L.end", "end",
+# "end-1c", "X lineend", "X +1c").
+FAKE_TEXT_WIDGET = r"""
+set ::text ""
+proc text_lines {} {
+    if {$::text eq ""} {return [list ""]}
+    return [split $::text \n]
+}
+proc position {index} {
+    set lines [text_lines]
+    set count [llength $lines]
+    if {[regexp {^(.*) lineend$} $index -> base]} {
+        lassign [position $base] line column
+        if {$line > $count} {return [list $line 0]}
+        return [list $line [string length [lindex $lines $line-1]]]
+    }
+    if {[regexp {^(.*) \+1c$} $index -> base]} {
+        lassign [position $base] line column
+        if {$line > $count} {return [list $line 0]}
+        if {$column < [string length [lindex $lines $line-1]]} {return [list $line [expr {$column + 1}]]}
+        return [list [expr {$line + 1}] 0]
+    }
+    if {$index eq "end"} {return [list [expr {$count + 1}] 0]}
+    if {$index eq "end-1c"} {return [list $count [string length [lindex $lines end]]]}
+    lassign [split $index .] line column
+    if {$line > $count} {return [list [expr {$count + 1}] 0]}
+    if {$line < 1} {return {1 0}}
+    set length [string length [lindex $lines $line-1]]
+    if {$column eq "end" || $column > $length} {set column $length}
+    return [list $line $column]
+}
+proc offset {index} {
+    lassign [position $index] line column
+    set offset $column
+    foreach text [lrange [text_lines] 0 $line-2] {incr offset [expr {[string length $text] + 1}]}
+    return $offset
+}
+proc remove {from to} {
+    set ::text [string range $::text 0 $from-1][string range $::text $to end]
+}
+proc add {at chars} {
+    set at [expr {min($at, [string length $::text])}]
+    set ::text [string range $::text 0 $at-1]$chars[string range $::text $at end]
+}
+proc .text_widget {op args} {
+    switch -- $op {
+        index {
+            lassign [position [lindex $args 0]] line column
+            return $line.$column
+        }
+        count {
+            lassign $args option from to
+            return [expr {[offset $to] - [offset $from]}]
+        }
+        get {
+            lassign $args from to
+            return [string range "$::text\n" [offset $from] [offset $to]-1]
+        }
+        insert {
+            add [offset [lindex $args 0]] [lindex $args 1]
+        }
+        delete {
+            set from [offset [lindex $args 0]]
+            set to [expr {[llength $args] > 1 ? [offset [lindex $args 1]] : $from + 1}]
+            if {$from >= $to} return
+            set length [string length $::text]
+            if {$to > $length} {
+                # Like Tk: the final newline stays, and a delete from the start
+                # of a line takes the newline before it instead
+                set to $length
+                if {$from > 0 && [string index $::text $from-1] eq "\n"} {incr from -1}
+            }
+            if {$from < $to} {remove $from $to}
+        }
+        replace {
+            lassign $args from to chars
+            set from [offset $from]
+            set to [expr {min([offset $to], [string length $::text])}]
+            if {$from < $to} {remove $from $to}
+            add $from $chars
+        }
+        default {error "bad option \"$op\""}
+    }
+    return ""
+}
+"""
+
+
+def tracker_proc():
+    """Return the Tcl source of the edit tracker proc from EduMerge.py."""
+    tree = ast.parse(SOURCE.read_text(encoding="utf-8"))
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Constant) and str(node.value).startswith("proc track_text_edits"):
+            return node.value
+    raise AssertionError("track_text_edits proc not found")
+
+
+@unittest.skipUnless(util.find_spec("ttkbootstrap") and util.find_spec("PIL"), "needs ttkbootstrap and Pillow")
+class EditTrackerTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app_class = load_definitions()["ModernEditorApp"]
+        cls.proc = tracker_proc()
+
+    def setUp(self):
+        self.tcl = tkinter.Tcl()
+        self.tcl.eval(FAKE_TEXT_WIDGET)
+        self.tcl.eval(self.proc)
+
+        self.app = SimpleNamespace(_line_words=[0], _word_total=0, _dirty_lines=[], _char_total=0)
+        self.app.text_area = SimpleNamespace(get=lambda first, last: self.text("get", first, last))
+        for method in ("_on_lines_edited", "_count_words"):
+            setattr(self.app, method, MethodType(getattr(self.app_class, method), self.app))
+        self.tcl.call(
+            "interp", "alias", "", ".text", "", "track_text_edits",
+            ".text_widget", self.tcl.register(self.app._on_lines_edited)
+        )
+
+    def text(self, *args):
+        return self.tcl.call(".text", *args)
+
+    def assert_counts(self, content):
+        """Check the text and every tracked count against a full recount."""
+        self.assertEqual(self.tcl.getvar("text"), content)
+        self.assertEqual(self.app._count_words(), len(re.findall(r"\S+", content)))
+        self.assertEqual(len(self.app._line_words), content.count("\n") + 1)
+        self.assertEqual(self.app._char_total, len(content))
+
+    def test_typing_and_new_lines(self):
+        for chars in "Dear Ann,\n\nHello":
+            self.text("insert", "end-1c", chars)
+        self.assert_counts("Dear Ann,\n\nHello")
+
+    def test_paste_in_the_middle(self):
+        self.text("insert", "1.0", "one two\nthree")
+        self.text("insert", "1.4", "a\nb c\n")
+        self.assert_counts("one a\nb c\ntwo\nthree")
+
+    def test_single_character_delete_joins_lines(self):
+        self.text("insert", "1.0", "one\ntwo\nthree")
+        self.text("delete", "1.end")
+        self.assert_counts("onetwo\nthree")
+
+    def test_delete_across_lines(self):
+        self.text("insert", "1.0", "one\ntwo\nthree\nfour")
+        self.text("delete", "1.2", "3.1")
+        self.assert_counts("onhree\nfour")
+
+    def test_delete_last_line_to_end_takes_newline_before_it(self):
+        self.text("insert", "1.0", "one\ntwo\nthree")
+        self.assert_counts("one\ntwo\nthree")
+        self.text("delete", "3.0", "end")
+        self.assert_counts("one\ntwo")
+        self.text("delete", "2.0", "end")
+        self.assert_counts("one")
+
+    def test_delete_empty_last_line(self):
+        self.text("insert", "1.0", "one\n")
+        self.assert_counts("one\n")
+        self.text("delete", "end-1c")
+        self.assert_counts("one")
+
+    def test_pending_ranges_move_with_later_edits(self):
+        self.text("insert", "1.0", "a\nb\nc\nd\ne")
+        self.assert_counts("a\nb\nc\nd\ne")
+        self.text("insert", "5.0", "x y ")
+        self.text("delete", "4.0", "end")
+        self.text("insert", "1.0", "z\n")
+        self.assert_counts("z\na\nb\nc")
+
+    def test_replace(self):
+        self.text("insert", "1.0", "one\ntwo\nthree")
+        self.text("replace", "1.1", "2.2", "X\nY Z")
+        self.assert_counts("oX\nY Zo\nthree")
+
+    def test_clear_all(self):
+        self.text("insert", "1.0", "one\ntwo\nthree")
+        self.text("delete", "1.0", "end")
+        self.assert_counts("")
+
+    def test_other_commands_pass_through(self):
+        self.text("insert", "1.0", "one")
+        self.assertEqual(self.text("index", "end-1c"), "1.3")
+        with self.assertRaises(tkinter.TclError):
+            self.text("bogus")
+        self.assert_counts("one")
+
+    def test_random_edits(self):
+        rng = random.Random(7)
+        pieces = ["ann", "bob lee", "  ", "x-y", "\n", "\n\n", "cy\nd", " "]
+        for step in range(400):
+            lines = int(self.text("index", "end-1c").split(".")[0])
+            indices = ["end", "end-1c", f"{rng.randint(1, lines + 1)}.{rng.randint(0, 6)}", f"{rng.randint(1, lines)}.end"]
+            choice = rng.random()
+            if choice < 0.5:
+                self.text("insert", rng.choice(indices), "".join(rng.choices(pieces, k=rng.randint(1, 4))))
+            elif choice < 0.7:
+                self.text("delete", rng.choice(indices))
+            elif choice < 0.95:
+                self.text("delete", rng.choice(indices), rng.choice(indices))
+            else:
+                self.text("delete", "1.0", "end")
+            if step % 5 == 0:
+                self.assert_counts(self.tcl.getvar("text"))
+        self.assert_counts(self.tcl.getvar("text"))
+
+
+if __name__ == "__main__":
+    unittest.main()